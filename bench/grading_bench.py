@@ -0,0 +1,67 @@
+"""등급 계산 벤치마크: 행 단위 .apply(get_grade) vs utils.grading 벡터화.
+
+사용법 (저장소 루트에서):
+    python -m bench.grading_bench              # 11,000행, 10,000,000행
+    python -m bench.grading_bench --rows 11000 100000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.grading import GRADE_COLUMNS, add_grade_columns
+
+
+def get_grade(score):
+    # 기존 페이지에 있던 행 단위 등급 함수 (비교 기준)
+    if score >= 80:
+        return "A (우수)"
+    elif score >= 60:
+        return "B (보통)"
+    elif score >= 40:
+        return "C (주의)"
+    else:
+        return "D (위험)"
+
+
+def make_scores(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({col: rng.uniform(0, 100, rows).round(1) for col in GRADE_COLUMNS})
+
+
+def grade_apply(df):
+    for score_col, grade_col in GRADE_COLUMNS.items():
+        df[grade_col] = df[score_col].apply(get_grade)
+    return df
+
+
+def timed(fn, df, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        frame = df.copy()
+        start = time.perf_counter()
+        fn(frame)
+        best = min(best, time.perf_counter() - start)
+    return best, frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[11_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'apply (s)':>12} {'vectorized (s)':>15} {'speedup':>9}")
+    for rows in args.rows:
+        df = make_scores(rows)
+        # 10M 행 apply 는 수십 초가 걸리므로 1회만 측정
+        apply_s, expected = timed(grade_apply, df, 1 if rows > 1_000_000 else args.repeat)
+        vector_s, actual = timed(add_grade_columns, df, args.repeat)
+        for grade_col in GRADE_COLUMNS.values():
+            assert (actual[grade_col].astype(str) == expected[grade_col]).all()
+        print(f"{rows:>12,} {apply_s:>12.4f} {vector_s:>15.4f} {apply_s / vector_s:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""연도 보간 벤치마크: 기업별 pandas .interpolate() 반복 vs utils.interpolate 일괄 처리.
+
+esg_data.csv 에서 지표 값을 무작위로 비워(기본 20%) 기업 수만큼의 희소 계열을 만들고,
+빈칸을 채우는 시간을 비교한다. 일괄 처리는 첫 호출(계산)과 두 번째 호출(계열 캐시)을 따로 잰다.
+
+사용법 (저장소 루트에서):
+    python -m bench.interpolate_bench
+    python -m bench.interpolate_bench --missing 0.4 --method spline
+"""
+import argparse
+import time
+
+import numpy as np
+
+from utils.esg_data import read_csv
+from utils.interpolate import _filled, fill_panel
+
+COLUMNS = [
+    "ESG_Environmental", "ESG_Social", "ESG_Governance", "ESG_Overall",
+    "CarbonEmissions", "WaterUsage", "EnergyConsumption",
+]
+
+
+def per_company(df, method):
+    # 기존 방식: 기업마다 연도 순으로 컬럼별 보간
+    options = {"order": 3} if method == "spline" else {}
+    parts = []
+    for _, group in df.groupby("CompanyID"):
+        group = group.sort_values("Year").set_index("Year")
+        parts.append(group[COLUMNS].interpolate(method=method, limit_area="inside", **options))
+    return parts
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--missing", type=float, default=0.2, help="비울 값 비율")
+    # log_linear 은 양수 계열 전용이라 0 이 섞인 ESG 지표에는 쓰지 않음
+    parser.add_argument("--method", choices=["linear", "spline"], default="linear")
+    args = parser.parse_args()
+
+    df = read_csv()
+    rng = np.random.default_rng(0)
+    for col in COLUMNS:
+        df.loc[rng.random(len(df)) < args.missing, col] = np.nan
+    print(f"데이터: 기업 {df['CompanyID'].nunique():,}곳 × 지표 {len(COLUMNS)}개, "
+          f"빈칸 {df[COLUMNS].isna().mean().mean():.0%}, 방법 {args.method}")
+
+    try:
+        seconds, _ = timed(lambda: per_company(df, args.method))
+        print(f"기업별 pandas 보간     {seconds * 1000:>9.1f} ms")
+    except ImportError:
+        # pandas spline 보간은 scipy 가 필요
+        print("기업별 pandas 보간     (scipy 없음, 건너뜀)")
+
+    _filled.clear()
+    cold, result = timed(lambda: fill_panel(df, "CompanyID", COLUMNS, method=args.method))
+    warm, _ = timed(lambda: fill_panel(df, "CompanyID", COLUMNS, method=args.method))
+    print(f"일괄 보간 (계산)       {cold * 1000:>9.1f} ms")
+    print(f"일괄 보간 (계열 캐시)  {warm * 1000:>9.1f} ms")
+    print(f"채운 칸: {int(result[COLUMNS].notna().sum().sum() - df[COLUMNS].notna().sum().sum()):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""ESG 데이터 메모리 사용량·정확도 리포트: 기본 타입 vs 절약형(to_compact).
+
+사용법 (저장소 루트에서):
+    python -m bench.memory_bench
+    python -m bench.memory_bench --csv other.csv
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from utils.esg_data import CSV_FILE, METRIC_COLUMNS, read_csv, to_compact
+
+
+def memory_report(frames):
+    """컬럼별 메모리(바이트, 문자열 포함) 표. frames 는 {이름: 프레임}."""
+    report = pd.DataFrame({name: df.memory_usage(deep=True, index=False) for name, df in frames.items()})
+    report.loc["합계"] = report.sum()
+    return report
+
+
+def fidelity_report(original, converted):
+    """원본 CSV 값 대비 변환 프레임의 차이 (지표별 최대 절대/상대 오차, 소수 1자리 일치 여부)."""
+    rows = {}
+    for col in METRIC_COLUMNS:
+        a = original[col].to_numpy(dtype="float64")
+        b = converted[col].to_numpy(dtype="float64")
+        err = np.abs(a - b)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rel = np.where(a != 0, err / np.abs(a), 0.0)
+        rows[col] = {
+            "max_abs": np.nanmax(err),
+            "max_rel": np.nanmax(rel),
+            "소수1자리_일치": bool(np.array_equal(np.round(a, 1), np.round(b, 1), equal_nan=True)),
+        }
+    for col in original.columns.difference(METRIC_COLUMNS):
+        same = (original[col].astype(str).to_numpy() == converted[col].astype(str).to_numpy()).all()
+        rows[col] = {"max_abs": 0.0 if same else np.nan, "max_rel": 0.0 if same else np.nan, "소수1자리_일치": bool(same)}
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default=str(CSV_FILE))
+    args = parser.parse_args()
+
+    original = read_csv(args.csv)
+    frames = {
+        "기본": original,
+        "절약형": to_compact(original),
+        "절약형+float32": to_compact(original, float32=True),
+    }
+    report = memory_report(frames)
+    pd.set_option("display.width", 160)
+    print("📦 컬럼별 메모리 (KB)")
+    print((report / 1024).round(1).to_string())
+
+    total = report.loc["합계"]
+    print("\n📏 행당 바이트 / 기본 대비")
+    for name in frames:
+        print(f"  {name:<14} {total[name] / len(original):7.1f} B/행  {total['기본'] / total[name]:5.2f}x")
+
+    for name in ["절약형", "절약형+float32"]:
+        print(f"\n🎯 정확도: {name}")
+        print(fidelity_report(original, frames[name]).to_string(float_format="{:.3g}".format))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,400 @@
+"""페이지 벤치마크: main.py 와 pages/ 의 스크립트를 AppTest 로 헤드리스 실행.
+
+페이지마다 자주 쓰는 상호작용(최초 로드, 슬라이더·체크박스·선택 변경, 파일 업로드,
+표 정렬·페이지 이동)을 차례로 재현하고, 상호작용별로 벽시계 시간(반복 측정 중앙값),
+최대 메모리(tracemalloc 피크), 스크립트 전체 실행 횟수(rerun)를 기록한다.
+AppTest 는 위젯이 바뀌면 늘 스크립트 전체를 다시 실행하지만, 브라우저는 @st.fragment 안의
+위젯이면 그 조각만 다시 실행한다. 그래서 바뀐 위젯이 모두 조각 안에 있으면 여기서도 그 조각만
+실행하고(조각 밖 요소는 이전 결과 유지) scope 를 fragment, rerun 을 0 으로 기록한다.
+ESG 데이터·업로드를 쓰는 페이지는 esg_data.csv 의 10배·100배 합성 데이터에서도 잰다.
+합성 데이터는 .cache/bench/ 에 한 번 만들어 두고 다시 쓴다.
+
+사용법 (저장소 루트에서):
+    python -m bench.page_bench --save                  # 측정 결과를 기준선으로 저장
+    python -m bench.page_bench                         # 기준선과 비교 (회귀가 있으면 종료 코드 1)
+    python -m bench.page_bench --scales 1 --pages _07 _08 --threshold 0.5
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date
+from urllib import parse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit
+from streamlit.runtime.scriptrunner import RerunData
+from streamlit.runtime.scriptrunner_utils.script_requests import ScriptRequests
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.local_script_runner import (
+    LocalScriptRunner, parse_tree_from_messages, require_widgets_deltas,
+)
+
+from bench.session_memory_bench import make_scaled
+from utils.esg_data import CACHE_DIR
+from utils import votes
+from utils.registry import DATASETS, ROOT
+
+BASELINE = Path(__file__).with_name("page_baseline.json")
+SCRATCH = CACHE_DIR / "bench"
+MB = 1024 * 1024
+
+# 기준선 대비 허용 증가 비율, 아주 짧은 구간의 잡음을 흡수하는 절대 여유
+THRESHOLD = 0.3
+SLACK_SECONDS = 0.05
+SLACK_MB = 2.0
+
+# 배수 1 기준 업로드 CSV 행 수 (01 페이지)
+UPLOAD_ROWS = 20_000
+
+# st.page_link 로 다른 페이지를 가리켜 진입점(main.py)에서 열어야 하는 페이지
+VIA_MAIN = {"pages/11_이상치탐지.py"}
+
+# 스크립트 한 번 실행에 주는 최대 시간 (100배 데이터의 첫 스냅샷 생성 포함)
+TIMEOUT = 600
+
+
+# --- 상호작용 ---------------------------------------------------------------
+
+def _narrow_slider(index):
+    # 범위 슬라이더를 앞쪽 절반으로 좁힘
+    def action(at, scale):
+        slider = at.slider[index]
+        lo, hi = slider.value
+        slider.set_value((lo, lo + (hi - lo) // 2))
+    return action
+
+
+def _check(index):
+    def action(at, scale):
+        at.checkbox[index].check()
+    return action
+
+
+def _next_company(at, scale):
+    box = at.sidebar.selectbox[0]
+    box.select_index((box.index + 1) % len(box.options))
+
+
+def _sort_table(at, scale):
+    at.selectbox(key="esg_table_sort").set_value("ESG_Overall")
+    at.toggle(key="esg_table_desc").set_value(True)
+
+
+def _next_page(at, scale):
+    at.number_input(key="esg_table_page").increment()
+
+
+def _previous_year(at, scale):
+    year = at.select_slider[0]
+    year.set_value(year.value - 1)
+
+
+def _query(at, scale):
+    at.text_area[0].set_value("SELECT Industry, Region, avg(ESG_Overall) AS esg FROM esg WHERE Year = 2025 GROUP BY ALL")
+    at.button[0].click()
+
+
+def _upload(at, scale):
+    at.file_uploader[0].set_value(("energy.csv", make_upload(scale), "text/csv"))
+
+
+_uploads = {"count": 0}
+
+
+def make_upload(scale):
+    """01 페이지용 업로드 CSV (Country, Energy_Consumption, GDP).
+
+    업로드 결과는 내용 해시로 캐시되므로, 매번 마지막 행을 바꿔 실제 파싱 비용을 잰다.
+    """
+    rows = UPLOAD_ROWS * scale
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        "Country": rng.choice([f"Country_{i:02d}" for i in range(50)], rows),
+        "Energy_Consumption": rng.uniform(10, 1000, rows).round(2),
+        "GDP": rng.uniform(1e3, 1e6, rows).round(2),
+    })
+    _uploads["count"] += 1
+    frame.loc[rows - 1, "GDP"] = _uploads["count"]
+    return frame.to_csv(index=False).encode("utf-8")
+
+
+# 페이지 → (데이터 배수 적용 여부, [(상호작용 이름, 실행 전 조작)]); 조작이 None 이면 그대로 실행
+SCENARIOS = {
+    "main.py": (False, [
+        ("load", None),
+        ("choose", lambda at, scale: at.radio[0].set_value("🍜 라면")),
+        ("submit", lambda at, scale: at.button[0].click()),
+    ]),
+    "pages/00_뚱이와스폰지밥.py": (False, [("load", None)]),
+    "pages/01_주제1.py": (True, [("load", None), ("upload", _upload)]),
+    # 연도 범위는 차트 안의 Altair 파라미터라 서버 상호작용이 없음
+    "pages/02_전세계자동차판매량.py": (False, [("load", None)]),
+    "pages/03_지속가능한경영전략.py": (False, [("load", None)]),
+    "pages/04_지속가능.py": (False, [("load", None), ("years", _narrow_slider(0))]),
+    "pages/05_팀주제발표.py": (True, [("load", None), ("table_sort", _sort_table), ("table_page", _next_page)]),
+    "pages/06_주제발표완성본.py": (True, [
+        ("load", None),
+        ("score_trend", _check(0)),
+        ("environment", _check(1)),
+        ("table_page", _next_page),
+    ]),
+    # 한 기업 표는 한 페이지뿐이라 페이지 이동 대신 정렬
+    "pages/_07.py": (True, [
+        ("load", None),
+        ("company", _next_company),
+        ("years", _narrow_slider(0)),
+        ("table_sort", _sort_table),
+    ]),
+    "pages/_08.py": (True, [
+        ("load", None),
+        ("company", _next_company),
+        ("years", _narrow_slider(0)),
+        ("table_sort", _sort_table),
+    ]),
+    "pages/09_동종업계벤치마킹.py": (True, [
+        ("load", None),
+        ("company", _next_company),
+        ("year", _previous_year),
+        ("scope", lambda at, scale: at.radio[0].set_value("전체")),
+    ]),
+    "pages/10_SQL질의.py": (True, [("load", None), ("query", _query)]),
+    "pages/11_이상치탐지.py": (True, [
+        ("load", None),
+        ("direction", lambda at, scale: at.radio[0].set_value("급증")),
+        ("company", lambda at, scale: at.selectbox[-1].select_index(1)),
+    ]),
+}
+
+
+# --- 측정 -------------------------------------------------------------------
+
+_runs = {"count": 0}
+
+
+def count_reruns():
+    """AppTest 스크립트 실행마다 카운터를 올리도록 LocalScriptRunner 를 감쌈."""
+    new_module = LocalScriptRunner._new_module
+
+    def counting(self, name):
+        # 조각만 다시 실행할 때도 모듈은 새로 만들어지므로 세지 않음
+        if not _fragments["running"]:
+            _runs["count"] += 1
+        return new_module(self, name)
+
+    LocalScriptRunner._new_module = counting
+
+
+# 마지막 실행의 메시지, 위젯 id → 그 위젯을 그린 조각 id, 다음 실행에서 다시 실행할 조각 id
+_fragments = {"messages": [], "widgets": {}, "queue": [], "running": []}
+
+
+def scoped_reruns():
+    """LocalScriptRunner.run 을 바꿔, _fragments["queue"] 가 있으면 그 조각만 다시 실행.
+
+    조각 밖 요소는 이전 실행 메시지를 큐에 다시 넣어 두면 실행 시작 때 AppSession 과 같은
+    규칙으로 정리된다(다시 실행하는 조각의 요소만 지워짐).
+    """
+    def run(self, widget_state=None, query_params=None, timeout=3, page_hash=""):
+        queue, _fragments["queue"] = _fragments["queue"], []
+        _fragments["running"] = queue
+        if queue:
+            for msg in _fragments["messages"]:
+                self.forward_msg_queue.enqueue(msg)
+        # 생성자가 넣어 둔 전체 실행 요청과 합쳐지지 않게 요청 목록을 새로 만듦
+        self._requests = ScriptRequests()
+        self.request_rerun(RerunData(
+            widget_states=widget_state,
+            query_string=parse.urlencode(query_params or {}, doseq=True),
+            page_script_hash=page_hash,
+            fragment_id_queue=queue,
+            is_fragment_scoped_rerun=bool(queue),
+        ))
+        try:
+            if not self._script_thread:
+                self.start()
+            require_widgets_deltas(self, timeout)
+        finally:
+            self.join()
+        # 남겨 둔 요소와 새 요소가 섞이므로 화면 위치(delta_path) 순으로 정렬
+        messages = sorted(self.forward_msgs(), key=lambda msg: tuple(msg.metadata.delta_path))
+        _fragments["messages"] = messages
+        for msg in messages:
+            if msg.HasField("delta") and msg.delta.WhichOneof("type") == "new_element":
+                element = msg.delta.new_element
+                widget_id = getattr(getattr(element, element.WhichOneof("type")), "id", "")
+                if widget_id:
+                    _fragments["widgets"][widget_id] = msg.delta.fragment_id
+        return parse_tree_from_messages(messages)
+
+    LocalScriptRunner.run = run
+
+
+def touched_fragments(before, at):
+    """조작 전 위젯 상태(before)와 비교해, 바뀐 위젯이 모두 조각 안이면 그 조각 id 목록."""
+    changed = [w.id for w in at._tree.get_widget_states().widgets if before.get(w.id) != w]
+    fragments = [_fragments["widgets"].get(widget_id) for widget_id in changed]
+    if not changed or not all(fragments):
+        return []
+    return list(dict.fromkeys(fragments))
+
+
+def dataset_for(scale):
+    """배수별 ESG CSV 경로 (1 이면 원본)."""
+    if scale == 1:
+        return DATASETS["esg"]
+    target = SCRATCH / f"esg_data_x{scale}.csv"
+    if not target.exists():
+        SCRATCH.mkdir(parents=True, exist_ok=True)
+        make_scaled(scale, SCRATCH)
+    return target
+
+
+def run_page(page, scale, repeat):
+    """페이지 한 개의 상호작용별 {seconds, peak_mb, reruns, scope}.
+
+    첫 회차는 캐시 워밍업, 두 번째는 tracemalloc 으로 메모리만, 이후 repeat 회는 시간만 잰다.
+    """
+    _, steps = SCENARIOS[page]
+    seconds = {name: [] for name, _ in steps}
+    result = {name: {} for name, _ in steps}
+    for attempt in range(repeat + 2):
+        traced = attempt == 1
+        if page in VIA_MAIN:
+            # 진입점 실행은 측정하지 않음
+            at = AppTest.from_file(str(ROOT / "main.py"), default_timeout=TIMEOUT).run()
+            at.switch_page(page)
+        else:
+            at = AppTest.from_file(str(ROOT / page), default_timeout=TIMEOUT)
+        for name, action in steps:
+            if action is not None:
+                before = {w.id: w for w in at._tree.get_widget_states().widgets}
+                action(at, scale)
+                _fragments["queue"] = touched_fragments(before, at)
+            result[name]["scope"] = "fragment" if _fragments["queue"] else "full"
+            runs = _runs["count"]
+            if traced:
+                tracemalloc.start()
+            start = time.perf_counter()
+            at.run()
+            elapsed = time.perf_counter() - start
+            if traced:
+                result[name]["peak_mb"] = round(tracemalloc.get_traced_memory()[1] / MB, 2)
+                tracemalloc.stop()
+            if at.exception:
+                raise RuntimeError(f"{page} [{name}]: {at.exception[0].value}")
+            result[name]["reruns"] = _runs["count"] - runs
+            if attempt >= 2:
+                seconds[name].append(elapsed)
+    for name in result:
+        result[name]["seconds"] = round(statistics.median(seconds[name]), 4)
+    return result
+
+
+def run_all(pages, scales, repeat):
+    """{"x배수": {페이지: {상호작용: 측정값}}}."""
+    results = {}
+    original = DATASETS["esg"]
+    try:
+        for scale in scales:
+            DATASETS["esg"] = dataset_for(scale)
+            scaled = results.setdefault(f"x{scale}", {})
+            for page in pages:
+                uses_data, _ = SCENARIOS[page]
+                if scale != 1 and not uses_data:
+                    continue
+                print(f"… x{scale} {page}", file=sys.stderr, flush=True)
+                scaled[page] = run_page(page, scale, repeat)
+    finally:
+        DATASETS["esg"] = original
+    return results
+
+
+def compare(results, baseline, threshold):
+    """기준선보다 threshold 비율(+절대 여유) 넘게 나빠진 항목 목록."""
+    regressions = []
+    for scale, pages in results.items():
+        for page, steps in pages.items():
+            for name, now in steps.items():
+                base = baseline.get(scale, {}).get(page, {}).get(name)
+                if base is None:
+                    continue
+                label = f"{scale} {page} [{name}]"
+                if now["seconds"] > base["seconds"] * (1 + threshold) + SLACK_SECONDS:
+                    regressions.append(f"{label} 시간 {base['seconds']:.3f}s → {now['seconds']:.3f}s")
+                if now["peak_mb"] > base["peak_mb"] * (1 + threshold) + SLACK_MB:
+                    regressions.append(f"{label} 메모리 {base['peak_mb']:.1f}MB → {now['peak_mb']:.1f}MB")
+                if now["reruns"] > base["reruns"]:
+                    regressions.append(f"{label} 실행 횟수 {base['reruns']} → {now['reruns']}")
+    return regressions
+
+
+def print_table(results, baseline):
+    print(f"{'scale':>5}  {'page':<28} {'interaction':<17} {'seconds':>9} {'vs base':>8} {'peak MB':>9} "
+          f"{'reruns':>6}  scope")
+    for scale, pages in results.items():
+        for page, steps in pages.items():
+            for name, now in steps.items():
+                base = baseline.get(scale, {}).get(page, {}).get(name)
+                delta = f"{(now['seconds'] / base['seconds'] - 1) * 100:+.0f}%" if base and base["seconds"] else "-"
+                print(f"{scale:>5}  {Path(page).name:<28} {name:<17} {now['seconds']:>9.3f} {delta:>8} "
+                      f"{now['peak_mb']:>9.1f} {now['reruns']:>6}  {now.get('scope', 'full')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", nargs="+", help="파일 이름 일부로 고를 페이지 (기본: 전부)")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100], help="데이터 배수")
+    parser.add_argument("--repeat", type=int, default=3, help="시간 측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="허용 증가 비율 (0.3 = 30%%)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="측정 결과를 기준선에 기록")
+    args = parser.parse_args()
+
+    pages = [page for page in SCENARIOS if not args.pages or any(p in page for p in args.pages)]
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+    count_reruns()
+    scoped_reruns()
+    # main.py 투표가 실제 투표 DB 에 쌓이지 않게
+    SCRATCH.mkdir(parents=True, exist_ok=True)
+    votes.VOTES_DB = SCRATCH / "votes.sqlite3"
+    results = run_all(pages, args.scales, args.repeat)
+    print_table(results, baseline.get("results", {}))
+
+    if args.save:
+        merged = baseline.get("results", {})
+        for scale, scaled in results.items():
+            merged.setdefault(scale, {}).update(scaled)
+        baseline = {
+            "meta": {
+                "date": date.today().isoformat(),
+                "python": platform.python_version(),
+                "streamlit": streamlit.__version__,
+                "machine": platform.platform(),
+                "repeat": args.repeat,
+            },
+            "results": merged,
+        }
+        args.baseline.write_text(json.dumps(baseline, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"💾 기준선 저장: {args.baseline}")
+        return
+
+    regressions = compare(results, baseline.get("results", {}), args.threshold)
+    if not baseline:
+        print("ℹ️ 기준선이 없습니다. --save 로 먼저 기록하세요.")
+    elif regressions:
+        print("❌ 성능 회귀:")
+        for line in regressions:
+            print("   " + line)
+        sys.exit(1)
+    else:
+        print("✅ 기준선 대비 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""세션 수에 따른 프로세스 메모리: 세션별 복사(cache_data) vs 공용 메모리 맵.
+
+세션마다 페이지가 들고 있는 ESG 프레임을 N 개 동시에 유지하고, 프로세스
+고유 메모리(RssAnon) 증가량을 잰다. 모드마다 새 프로세스에서 측정한다.
+
+사용법 (저장소 루트에서, Linux):
+    python -m bench.session_memory_bench
+    python -m bench.session_memory_bench --sessions 1 10 100 --scale 10
+"""
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from utils.esg_data import CSV_FILE
+
+MB = 1024 * 1024
+
+
+def measure(mode, sessions, csv):
+    # 측정용 하위 프로세스: 세션 수별 RssAnon 증가량(MB) 반환
+    from utils.company_index import load_company_index
+    from utils.shared_store import load_shared_esg, process_memory
+
+    loader = load_shared_esg if mode == "shared" else load_company_index
+    loader(csv)  # 캐시 워밍업 (스냅샷·파생 산출물 생성)
+    gc.collect()
+    base = process_memory()["rss_anon"]
+    held, result = [], {}
+    for n in sessions:
+        while len(held) < n:
+            held.append(loader(csv))
+        gc.collect()
+        result[n] = (process_memory()["rss_anon"] - base) / MB
+    return result
+
+
+def make_scaled(scale, directory):
+    """esg_data.csv 를 scale 배로 늘린 합성 CSV (CompanyID 를 겹치지 않게 이동)."""
+    df = pd.read_csv(CSV_FILE)
+    step = int(df["CompanyID"].max())
+    parts = []
+    for i in range(scale):
+        part = df.copy()
+        part["CompanyID"] += i * step
+        part["CompanyName"] = "Company_" + part["CompanyID"].astype(str)
+        parts.append(part)
+    target = Path(directory) / f"esg_data_x{scale}.csv"
+    pd.concat(parts, ignore_index=True).to_csv(target, index=False)
+    return target
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50, 100])
+    parser.add_argument("--scale", type=int, default=1, help="데이터 배수 (1 = esg_data.csv 그대로)")
+    parser.add_argument("--measure", nargs=2, metavar=("MODE", "CSV"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        mode, csv = args.measure
+        print(json.dumps(measure(mode, args.sessions, csv)))
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv = CSV_FILE if args.scale == 1 else make_scaled(args.scale, directory)
+        results = {}
+        for mode in ["copy", "shared"]:
+            out = subprocess.run(
+                [sys.executable, "-m", "bench.session_memory_bench", "--measure", mode, str(csv),
+                 "--sessions", *map(str, args.sessions)],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            results[mode] = json.loads(out.strip().splitlines()[-1])
+
+    print(f"데이터: {csv.name if args.scale == 1 else f'esg_data.csv x{args.scale}'}")
+    print(f"{'sessions':>9} {'copy (MB)':>11} {'shared (MB)':>12}")
+    for n in args.sessions:
+        print(f"{n:>9} {results['copy'][str(n)]:>11.1f} {results['shared'][str(n)]:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""유사 기업 조회 벤치마크: utils.similarity 인덱스의 생성 시간과 조회 지연.
+
+esg_data.csv 의 지표 분포를 따라 기업 수만 늘린 합성 데이터(기본 10만 곳 × 3개 연도)로
+인덱스를 만들고, 무작위 기업 조회의 지연(p50/p95)을 잰다. 처음 몇 건은 전체 거리를
+직접 정렬한 결과와 같은지 확인한다.
+
+사용법 (저장소 루트에서):
+    python -m bench.similarity_bench
+    python -m bench.similarity_bench --companies 1000000 --years 1 --finance
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.esg_data import read_csv
+from utils.similarity import FINANCE_COLUMNS, INDEX_COLUMNS, PROFILE_COLUMNS, build_similarity_index, nearest
+
+
+def make_companies(companies, years):
+    """원본 행을 무작위로 뽑아 값을 ±5% 흔든 (기업 × 연도) 합성 프레임."""
+    source = read_csv()
+    rng = np.random.default_rng(0)
+    rows = source.sample(companies * years, replace=True, random_state=0).reset_index(drop=True)
+    rows[INDEX_COLUMNS] = rows[INDEX_COLUMNS] * rng.uniform(0.95, 1.05, (len(rows), len(INDEX_COLUMNS)))
+    rows["CompanyID"] = np.tile(np.arange(1, companies + 1), years)
+    rows["Year"] = np.repeat(np.arange(2025 - years + 1, 2026), companies)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--companies", type=int, default=100_000)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--finance", action="store_true", help="매출·이익률 포함")
+    args = parser.parse_args()
+    columns = PROFILE_COLUMNS + (FINANCE_COLUMNS if args.finance else [])
+
+    df = make_companies(args.companies, args.years)
+    start = time.perf_counter()
+    index = build_similarity_index(df)
+    print(f"인덱스 생성: 기업 {args.companies:,}곳 × {args.years}개 연도, "
+          f"{(time.perf_counter() - start) * 1000:,.0f} ms, "
+          f"{sum(entry['matrix'].nbytes for entry in index.values()) / 1024 / 1024:.1f} MB")
+
+    entry = index[2025]
+    rng = np.random.default_rng(1)
+    timings = []
+    for i, cid in enumerate(rng.integers(1, args.companies + 1, args.queries)):
+        start = time.perf_counter()
+        ids, distances = nearest(entry, int(cid), args.k, columns)
+        timings.append(time.perf_counter() - start)
+        if i < 5:
+            # 전체 거리 정렬 결과와 비교
+            cols = [INDEX_COLUMNS.index(col) for col in columns]
+            full = pd.Series(((entry["matrix"][:, cols] - entry["matrix"][cid - 1, cols]) ** 2).sum(axis=1))
+            expected = full.drop(cid - 1).nsmallest(args.k)
+            assert np.allclose(np.sqrt(expected.to_numpy()), distances, atol=1e-4), cid
+    ms = np.array(timings) * 1000
+    print(f"조회 {args.queries}건 (k={args.k}, 지표 {len(columns)}개): "
+          f"p50 {np.percentile(ms, 50):.2f} ms, p95 {np.percentile(ms, 95):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
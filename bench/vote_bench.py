@@ -0,0 +1,207 @@
+"""투표 저장 부하 테스트: 클릭마다 연결·커밋 vs utils.votes 단일 작성 스레드.
+
+스레드 여러 개가 동시에 표를 제출하는 상황(동시 클릭)을 만들어, 모든 표가 기록될
+때까지의 처리량(표/초), 제출 한 번의 지연(p50/p99), 잠금 오류 수, DB 행 수를 비교한다.
+
+--live 는 실시간 결과(main.py 프래그먼트) 부하 테스트: 분당 --rate 표를 이 프로세스의
+저장소와 "다른 서버 프로세스"(직접 INSERT) 양쪽에서 넣는 동안, --sessions 개 세션이
+새로 고침마다 읽는 snapshot() 지연, 다른 프로세스 표가 집계에 보이기까지의 지연,
+그리고 같은 시점에 전체를 다시 세는(GROUP BY) 비용을 잰다.
+DB 는 .cache/bench/ 아래 임시 파일을 쓴다.
+
+사용법 (저장소 루트에서):
+    python -m bench.vote_bench
+    python -m bench.vote_bench --threads 200 --votes 50
+    python -m bench.vote_bench --live --rate 6000 --seconds 20 --preload 1000000
+"""
+import argparse
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+import numpy as np
+
+from utils.esg_data import CACHE_DIR
+from utils.votes import VoteStore, connect
+
+SCRATCH = CACHE_DIR / "bench"
+OPTIONS = ["🍕 피자", "🍔 햄버거", "🍜 라면", "🥗 샐러드"]
+
+
+def fresh_db(name):
+    SCRATCH.mkdir(parents=True, exist_ok=True)
+    path = SCRATCH / name
+    for suffix in ("", "-wal", "-shm"):
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+    connect(str(path)).close()
+    return path
+
+
+def naive_vote(path, option):
+    # 기존 방식으로 만들었다면: 클릭마다 연결을 열고 바로 커밋
+    with closing(sqlite3.connect(path, timeout=5)) as con:
+        with con:
+            con.execute("INSERT INTO votes (option, created) VALUES (?, ?)", (option, time.time()))
+            con.execute(
+                "INSERT INTO tallies (option, count) VALUES (?, 1) "
+                "ON CONFLICT(option) DO UPDATE SET count = count + 1",
+                (option,),
+            )
+
+
+def hammer(threads, votes, submit):
+    """threads 개 스레드가 votes 번씩 submit → (경과 초, 제출 지연 배열, 오류 수)."""
+    latencies = [[] for _ in range(threads)]
+    errors = [0] * threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(i):
+        rng = np.random.default_rng(i)
+        barrier.wait()
+        for option in rng.choice(OPTIONS, votes):
+            start = time.perf_counter()
+            try:
+                submit(str(option))
+            except sqlite3.OperationalError:
+                errors[i] += 1
+            latencies[i].append(time.perf_counter() - start)
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start, np.concatenate(latencies), sum(errors)
+
+
+def row_count(path):
+    with closing(sqlite3.connect(path)) as con:
+        return con.execute("SELECT COUNT(*) FROM votes").fetchone()[0]
+
+
+def report(label, total, seconds, latencies, errors, rows):
+    ms = latencies * 1000
+    print(f"{label:<18} {total / seconds:>10,.0f} 표/s   p50 {np.percentile(ms, 50):>7.3f} ms   "
+          f"p99 {np.percentile(ms, 99):>8.3f} ms   오류 {errors:>5,}   기록 {rows:,}/{total:,}")
+
+
+def preload(path, rows):
+    """기존 투표 rows 건을 한 번에 넣어 둠 (오래 운영된 DB 흉내, 시각은 하루 전)."""
+    rng = np.random.default_rng(0)
+    created = time.time() - 86_400
+    with closing(sqlite3.connect(path)) as con, con:
+        choices = rng.choice(OPTIONS, rows)
+        con.executemany("INSERT INTO votes (option, created) VALUES (?, ?)", ((str(o), created) for o in choices))
+        con.executemany("INSERT INTO tallies (option, count) VALUES (?, ?)",
+                        ((option, int((choices == option).sum())) for option in OPTIONS))
+
+
+def live(rate, seconds, sessions, refresh, rows):
+    path = fresh_db("votes_live.sqlite3")
+    preload(path, rows)
+    start = time.perf_counter()
+    store = VoteStore(path)
+    print(f"저장소 시작 (기존 {rows:,}표): {(time.perf_counter() - start) * 1000:,.1f} ms")
+
+    stop = threading.Event()
+    inserted = {}  # 다른 프로세스가 넣은 id → 넣은 시각
+
+    def local_clicks():
+        # 이 프로세스 사용자: 전체 속도의 3/4
+        interval = 60 / (rate * 0.75)
+        rng = np.random.default_rng(1)
+        while not stop.wait(interval):
+            store.submit(str(rng.choice(OPTIONS)))
+
+    def other_process():
+        # 다른 서버 프로세스: 나머지 1/4 를 직접 기록
+        interval = 60 / (rate * 0.25)
+        rng = np.random.default_rng(2)
+        with closing(sqlite3.connect(path, timeout=30)) as con:
+            while not stop.wait(interval):
+                option = str(rng.choice(OPTIONS))
+                with con:
+                    cur = con.execute("INSERT INTO votes (option, created) VALUES (?, ?)", (option, time.time()))
+                    con.execute("UPDATE tallies SET count = count + 1 WHERE option = ?", (option,))
+                inserted[cur.lastrowid] = time.perf_counter()
+
+    def watch():
+        # 다른 프로세스 표가 집계(last_id)에 들어오는 시점 기록
+        while not stop.wait(0.005):
+            last_id = store.last_id
+            now = time.perf_counter()
+            for row_id in [row_id for row_id in list(inserted) if row_id <= last_id]:
+                lags.append(now - inserted.pop(row_id))
+
+    snapshot_ms, lags, recount_ms = [], [], []
+    writers = [threading.Thread(target=fn) for fn in (local_clicks, other_process, watch)]
+    for thread in writers:
+        thread.start()
+
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        tick = time.perf_counter()
+        for _ in range(sessions):
+            start = time.perf_counter()
+            last_id, counts, buckets = store.snapshot()
+            snapshot_ms.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        with closing(sqlite3.connect(path)) as con:
+            con.execute("SELECT option, COUNT(*) FROM votes GROUP BY option").fetchall()
+        recount_ms.append((time.perf_counter() - start) * 1000)
+        time.sleep(max(0.0, refresh - (time.perf_counter() - tick)))
+    stop.set()
+    for thread in writers:
+        thread.join()
+    store.flush()
+    store.close()
+
+    snapshot_ms, lags = np.array(snapshot_ms), np.array(lags) * 1000
+    total = sum(store.counts().values())
+    print(f"부하: 분당 {rate:,}표 × {seconds}초, 세션 {sessions}개가 {refresh}초마다 새로 고침")
+    print(f"snapshot()        p50 {np.percentile(snapshot_ms, 50):.3f} ms   p99 {np.percentile(snapshot_ms, 99):.3f} ms")
+    if len(lags):
+        print(f"다른 프로세스 표 반영  p50 {np.percentile(lags, 50):.0f} ms   p95 {np.percentile(lags, 95):.0f} ms   ({len(lags):,}표)")
+    print(f"전체 다시 세기    p50 {np.median(recount_ms):.1f} ms (새로 고침·세션마다 하면 이만큼씩)")
+    tallies, actual = store.verify()
+    print(f"   메모리 누계 {total:,}표, DB 행 {sum(actual.values()):,}표, tallies 일치: {tallies == actual}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=50, help="동시에 클릭하는 스레드 수")
+    parser.add_argument("--votes", type=int, default=100, help="스레드당 제출 수")
+    parser.add_argument("--live", action="store_true", help="실시간 결과 부하 테스트")
+    parser.add_argument("--rate", type=int, default=6000, help="(--live) 분당 표 수")
+    parser.add_argument("--seconds", type=int, default=15, help="(--live) 측정 시간")
+    parser.add_argument("--sessions", type=int, default=50, help="(--live) 결과를 보는 세션 수")
+    parser.add_argument("--refresh", type=float, default=2.0, help="(--live) 새로 고침 간격(초)")
+    parser.add_argument("--preload", type=int, default=200_000, help="(--live) 미리 넣어 둘 표 수")
+    args = parser.parse_args()
+    if args.live:
+        live(args.rate, args.seconds, args.sessions, args.refresh, args.preload)
+        return
+    total = args.threads * args.votes
+
+    path = fresh_db("votes_naive.sqlite3")
+    seconds, latencies, errors = hammer(args.threads, args.votes, lambda option: naive_vote(path, option))
+    report("클릭마다 커밋", total, seconds, latencies, errors, row_count(path))
+
+    path = fresh_db("votes_batched.sqlite3")
+    store = VoteStore(path)
+    seconds, latencies, errors = hammer(args.threads, args.votes, store.submit)
+    # 처리량은 마지막 표가 커밋될 때까지
+    start = time.perf_counter()
+    store.flush()
+    seconds += time.perf_counter() - start
+    store.close()
+    report("단일 작성 스레드", total, seconds, latencies, errors, row_count(path))
+    tallies, actual = store.verify()
+    print(f"   배치 {store.batches:,}번, 누계 일치: {tallies == actual}, 메모리 카운터: {sum(store.counts().values()):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
+import pandas as pd
 import streamlit as st
 
+from utils.votes import BUCKET_SECONDS, get_vote_store
+
 st.set_page_config(page_title="간단한 투표 앱", page_icon="🗳️")
 
 st.title("🗳️ 당신의 선택은?")
@@ -8,9 +11,63 @@ st.write("아래 보기 중 하나를 선택하고 제출해보세요!")
 # 선택 항목
 options = ["🍕 피자", "🍔 햄버거", "🍜 라면", "🥗 샐러드"]
 
+# 실시간 결과 새로 고침 간격(초)과 득표 속도 차트 기간(초)
+REFRESH_SECONDS = 2
+RATE_WINDOW = 600
+
+# 프래그먼트가 몇 초마다 다시 그리므로 Altair 를 거치지 않는 Vega-Lite 사양을 직접 씀
+COUNT_SPEC = {
+    "mark": {"type": "bar"},
+    "encoding": {
+        "y": {"field": "보기", "type": "nominal", "sort": None, "title": None},
+        "x": {"field": "표", "type": "quantitative"},
+    },
+}
+RATE_SPEC = {
+    "mark": {"type": "line", "point": True},
+    "encoding": {
+        "x": {"field": "시각", "type": "temporal", "title": None},
+        "y": {"field": "표/분", "type": "quantitative"},
+        "color": {"field": "보기", "type": "nominal", "sort": options},
+    },
+}
+
+# 투표 저장소 (프로세스 공용, 기록은 작성 스레드가 모아서 처리)
+store = get_vote_store()
+
 # 사용자 선택
 choice = st.radio("무엇을 가장 좋아하나요?", options)
 
 # 제출 버튼
 if st.button("제출"):
+    store.submit(choice)
     st.success(f"당신은 **{choice}**를 선택했어요!")
+
+
+# 실시간 결과: 이 영역만 주기적으로 다시 실행 (스크립트 전체는 그대로)
+@st.fragment(run_every=REFRESH_SECONDS)
+def live_results():
+    # 저장소가 투표 id 순으로 더해 둔 집계만 읽음 (다시 세지 않음)
+    last_id, counts, buckets = store.snapshot(RATE_WINDOW)
+    seen = st.session_state.get("votes_seen_id", last_id)
+    st.session_state["votes_seen_id"] = last_id
+
+    total = sum(counts.get(option, 0) for option in options)
+    st.subheader(f"📊 현재 결과 (총 {total:,}표)")
+    if last_id > seen:
+        st.caption(f"🔄 지난 새로 고침 이후 새 표 {last_id - seen:,}개")
+    st.vega_lite_chart(
+        pd.DataFrame({"보기": options, "표": [counts.get(option, 0) for option in options]}), COUNT_SPEC
+    )
+
+    if buckets:
+        # 구간별 표 수 → 분당 득표 속도
+        rates = pd.DataFrame.from_dict(buckets, orient="index").reindex(columns=options).fillna(0)
+        rates.index = pd.to_datetime(rates.index, unit="s")
+        rates = rates.sort_index().asfreq(f"{BUCKET_SECONDS}s", fill_value=0) * (60 / BUCKET_SECONDS)
+        st.markdown(f"**⏱ 최근 {RATE_WINDOW // 60}분 득표 속도 (표/분, {BUCKET_SECONDS}초 단위)**")
+        rates = rates.rename_axis("시각").reset_index().melt("시각", var_name="보기", value_name="표/분")
+        st.vega_lite_chart(rates, RATE_SPEC)
+
+
+live_results()
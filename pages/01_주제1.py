@@ -1,5 +1,6 @@
 import streamlit as st
-import pandas as pd
+
+from utils.upload import cached_upload, missing_columns
 
 st.title("🌱 지속가능한 발전 대시보드")
 st.subheader("📊 에너지 소비량과 GDP의 관계 분석")
@@ -13,21 +14,36 @@ CSV 파일을 업로드하면 국가별 **에너지 소비량**과 **GDP** 데
 uploaded_file = st.file_uploader("📁 CSV 파일 업로드 (필드: Country, Energy_Consumption, GDP)", type="csv")
 
 if uploaded_file:
-    df = pd.read_csv(uploaded_file)
-    st.write("✅ 데이터 미리보기")
-    st.dataframe(df)
+    stats, error = None, None
+    # 헤더부터 확인 (빈 파일·인코딩 오류는 값 오류로 안내)
+    try:
+        missing = missing_columns(uploaded_file)
+    except ValueError as exc:
+        missing, error = [], exc
+
+    if not missing and error is None:
+        # 청크 단위로 읽으며 평균·국가별 집계를 누적 (같은 내용의 파일은 캐시에서 바로)
+        progress = st.empty()
+        try:
+            stats = cached_upload(uploaded_file, progress=lambda frac: progress.progress(frac, text=f"📥 CSV 읽는 중... {frac:.0%}"))
+        except ValueError as exc:
+            error = exc
+        progress.empty()
+
+    if stats is not None:
+        st.write("✅ 데이터 미리보기")
+        st.caption(f"전체 {stats['rows']:,}행 중 앞 {len(stats['preview']):,}행")
+        st.dataframe(stats["preview"])
 
-    # 숫자형 데이터 확인
-    if "Energy_Consumption" in df.columns and "GDP" in df.columns:
         st.subheader("📉 에너지 소비량")
-        st.bar_chart(df.set_index("Country")["Energy_Consumption"])
+        st.bar_chart(stats["by_country"]["Energy_Consumption"])
 
         st.subheader("💰 GDP (국내총생산)")
-        st.line_chart(df.set_index("Country")["GDP"])
+        st.line_chart(stats["by_country"]["GDP"])
 
         # 평균 출력
-        avg_energy = df["Energy_Consumption"].mean()
-        avg_gdp = df["GDP"].mean()
+        avg_energy = stats["means"]["Energy_Consumption"]
+        avg_gdp = stats["means"]["GDP"]
 
         st.markdown("### 📌 간단 분석 결과")
         st.write(f"- 평균 에너지 소비량: **{avg_energy:,.2f}**")
@@ -38,7 +54,9 @@ if uploaded_file:
         - 에너지 소비 효율과 경제 성장률을 함께 고려한 정책 수립이 필요합니다.
         - 특정 국가의 에너지 소비 대비 GDP 효율성이 높거나 낮은 경우, 벤치마킹 대상이 될 수 있습니다.
         """)
+    elif missing:
+        st.error("❗ 'Country', 'Energy_Consumption' 또는 'GDP' 컬럼이 없습니다.")
     else:
-        st.error("❗ 'Energy_Consumption' 또는 'GDP' 컬럼이 없습니다.")
+        st.error(f"❗ CSV 값을 읽을 수 없습니다: {error}")
 else:
     st.info("좌측에서 CSV 파일을 업로드해주세요.")
@@ -1,9 +1,9 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 import altair as alt
 import datetime
 
+from utils.interpolate import fill_years
+
 st.title("🌍 전 세계 자동차 생산량 & 대기 중 CO₂ 농도 변화 (1990–2024)")
 
 # 자동차 생산량 데이터
@@ -24,48 +24,39 @@ data_co2 = {
     2023: 421.24, 2024: 422.80
 }
 
-# 전체 연도 목록
-years = list(range(1990, 2025))
-df = pd.DataFrame({"year": years})
 
-# 데이터 보간
-df["production"] = df["year"].map(data_auto)
-df["production"] = df["production"].interpolate()
+def year_range(first, last, start, key):
+    """차트에 붙이는 시작/끝 연도 슬라이더 파라미터와 필터 조건 (브라우저에서 바로 적용)."""
+    start_year = alt.param(
+        name=f"{key}_start", value=start, bind=alt.binding_range(min=first, max=last, step=1, name="📅 시작 연도 ")
+    )
+    end_year = alt.param(
+        name=f"{key}_end", value=last, bind=alt.binding_range(min=first, max=last, step=1, name="📅 끝 연도 ")
+    )
+    return (start_year, end_year), (alt.datum.year >= start_year) & (alt.datum.year <= end_year)
 
-df["co2_ppm"] = df["year"].map(data_co2)
-df["co2_ppm"] = df["co2_ppm"].interpolate()
 
-# ✅ 연도 선택 슬라이더
-min_year, max_year = st.slider(
-    "📅 분석할 연도 범위를 선택하세요:",
-    min_value=min(years),
-    max_value=max(years),
-    value=(2000, 2024),
-    step=1
-)
+# 데이터 보간 (1990–2024, 두 계열을 한 번에 · 계열별 캐시)
+df = fill_years({"production": data_auto, "co2_ppm": data_co2}, 1990, 2024).reset_index()
 
-# 선택 범위 데이터 필터링
-df_filtered = df[(df["year"] >= min_year) & (df["year"] <= max_year)]
+# ✅ 연도 범위 선택 (차트 아래 슬라이더, 움직여도 서버 재실행 없음)
+params, in_range = year_range(1990, 2024, 2000, "years")
+base = alt.Chart(df).transform_filter(in_range).encode(x=alt.X("year:O", title="연도"))
 
 # 📊 자동차 생산량 그래프
-st.markdown("### 🚗 전 세계 자동차 생산량 (단위: 대)")
-auto_chart = alt.Chart(df_filtered).mark_line(color="steelblue").encode(
-    x=alt.X("year:O", title="연도"),
+auto_chart = base.mark_line(color="steelblue").encode(
     y=alt.Y("production:Q", title="자동차 생산량", scale=alt.Scale(zero=False))
-).properties(width=700, height=300)
-st.altair_chart(auto_chart, use_container_width=True)
+).properties(title="🚗 전 세계 자동차 생산량 (단위: 대)", width=700, height=300)
 
 # 📈 CO₂ 농도 그래프
-st.markdown("### 🌫️ 대기 중 CO₂ 농도 (단위: ppm)")
-co2_chart = alt.Chart(df_filtered).mark_line(color="darkred").encode(
-    x=alt.X("year:O", title="연도"),
+co2_chart = base.mark_line(color="darkred").encode(
     y=alt.Y("co2_ppm:Q", title="CO₂ 농도", scale=alt.Scale(zero=False))
-).properties(width=700, height=300)
-st.altair_chart(co2_chart, use_container_width=True)
+).properties(title="🌫️ 대기 중 CO₂ 농도 (단위: ppm)", width=700, height=300)
+st.altair_chart(alt.vconcat(auto_chart, co2_chart).add_params(*params), use_container_width=True)
 
 # 📋 데이터 테이블
-st.markdown("### 📋 선택한 연도 범위 데이터 미리보기")
-st.dataframe(df_filtered.reset_index(drop=True))
+st.markdown("### 📋 연도별 데이터")
+st.dataframe(df)
 
 # 📌 설명
 st.markdown("""
@@ -75,16 +66,10 @@ st.markdown("""
 - 📈 중간 연도는 선형 보간 처리됨  
 """)
 import streamlit as st
-import pandas as pd
-import numpy as np
 import altair as alt
 
 st.title("🚗 내연기관(ICE) vs 전기차(EV) 생산·판매량 비교 (2010–2024)")
 
-# 연도 리스트
-years = list(range(2010, 2025))
-df = pd.DataFrame({"year": years})
-
 # 전체 자동차 생산량 (Wikipedia 등 기반)
 total_prod = {
     2010: 77_857_705,
@@ -123,40 +108,28 @@ ev = {
     2024: 20.35e6
 }
 
-df["total"] = df["year"].map(total_prod).interpolate()
-df["ev"] = df["year"].map(ev).interpolate()
+# 데이터 보간 (2010–2024, 두 계열을 한 번에 · 계열별 캐시) + ICE = 전체 - EV
+df = fill_years({"total": total_prod, "ev": ev}, 2010, 2024).reset_index()
 df["ice"] = df["total"] - df["ev"]
 
-# 연도 범위 선택 슬라이더
-min_year, max_year = st.slider(
-    "📅 분석할 연도 범위를 선택하세요:",
-    min_value=2010,
-    max_value=2024,
-    value=(2015, 2024),
-    step=1
-)
-
-df_filtered = df[(df["year"] >= min_year) & (df["year"] <= max_year)]
+# 연도 범위 선택 (차트 아래 슬라이더, 움직여도 서버 재실행 없음)
+params, in_range = year_range(2010, 2024, 2015, "ev_years")
+base = alt.Chart(df).transform_filter(in_range).encode(x=alt.X("year:O", title="연도"))
 
 # EV 그래프
-st.markdown("### ⚡ 전기차(EV) 생산·판매량")
-ev_chart = alt.Chart(df_filtered).mark_line(color="green").encode(
-    x=alt.X("year:O", title="연도"),
+ev_chart = base.mark_line(color="green").encode(
     y=alt.Y("ev:Q", title="EV 생산·판매량 (대)")
-).properties(width=700, height=300)
-st.altair_chart(ev_chart, use_container_width=True)
+).properties(title="⚡ 전기차(EV) 생산·판매량", width=700, height=300)
 
 # ICE 그래프
-st.markdown("### 🛢 내연기관차(ICE) 생산량")
-ice_chart = alt.Chart(df_filtered).mark_line(color="orange").encode(
-    x=alt.X("year:O", title="연도"),
+ice_chart = base.mark_line(color="orange").encode(
     y=alt.Y("ice:Q", title="ICE 생산량 (대)")
-).properties(width=700, height=300)
-st.altair_chart(ice_chart, use_container_width=True)
+).properties(title="🛢 내연기관차(ICE) 생산량", width=700, height=300)
+st.altair_chart(alt.vconcat(ev_chart, ice_chart).add_params(*params), use_container_width=True)
 
 # 데이터 테이블
-st.markdown("### 📋 선택된 연도 데이터")
-st.dataframe(df_filtered[["year", "ev", "ice", "total"]].reset_index(drop=True))
+st.markdown("### 📋 연도별 데이터")
+st.dataframe(df[["year", "ev", "ice", "total"]])
 
 # 설명
 st.markdown("""
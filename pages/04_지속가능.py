@@ -2,6 +2,8 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
+from utils.grading import grade_label
+
 # 페이지 설정
 st.set_page_config(page_title="지속 가능한 경영 ESG 대시보드", layout="wide")     
 
@@ -53,18 +55,8 @@ with col3:
     renewable = filtered_df["재생에너지사용률(%)"].iloc[-1]
     st.metric("재생에너지 사용률", f"{renewable}%")
 
-# 🏅 ESG 등급 분류 함수
-def classify_esg(score):
-    if score >= 85:
-        return "A등급"
-    elif score >= 75:
-        return "B등급"
-    elif score >= 65:
-        return "C등급"
-    else:
-        return "D등급"
-
-esg_grade = classify_esg(avg_esg)
+# 🏅 ESG 등급 분류 (85/75/65 기준)
+esg_grade = grade_label(avg_esg, scheme="kpi")
 st.success(f"📊 ESG 등급: **{esg_grade}** (평균 점수 기준)")
 
 # 📋 원본 데이터 확인 및 다운로드
@@ -1,33 +1,25 @@
 import streamlit as st
 import pandas as pd
 
-st.set_page_config(page_title="ESG 분석 대시보드", layout="wide")
-
-CSV_FILE = "esg_data.csv" # ← 여기에 CSV 파일명 정확히 저장
-
-# CSV 파일 불러오기
-try:
-df = pd.read_csv(CSV_FILE)
-except FileNotFoundError:
-st.error(f"⚠️ 데이터 파일 '{CSV_FILE}' 이(가) 존재하지 않습니다.\n같은 폴더에 CSV 파일을 올려주세요.")
-st.stop()
+from utils.chart_data import chart_data
+from utils.esg_data import CSV_FILE, dataset_version
+from utils.grading import grade_label
+from utils.improvement import improvement_section, load_rule_hits
+from utils.shared_store import load_shared_esg
+from utils.table import paged_table
+from utils.timing import page_timer
 
-# ESG 등급 함수 정의
-def get_grade(score):
-if score >= 80:
-return "A (우수)"
-elif score >= 60:
-return "B (보통)"
-elif score >= 40:
-return "C (주의)"
-else:
-return "D (위험)"
+st.set_page_config(page_title="ESG 분석 대시보드", layout="wide")
+timer = page_timer("05")
 
-# 등급 계산
-df["Environmental_Grade"] = df["ESG_Environmental"].apply(get_grade)
-df["Social_Grade"] = df["ESG_Social"].apply(get_grade)
-df["Governance_Grade"] = df["ESG_Governance"].apply(get_grade)
-df["ESG_Grade"] = df["ESG_Overall"].apply(get_grade)
+# CSV 데이터 불러오기 (세션 공용 메모리 맵, 등급 컬럼 포함)
+with timer("데이터 로드"):
+    try:
+        df, _ = load_shared_esg("esg")
+        hits = load_rule_hits("esg")
+    except FileNotFoundError:
+        st.error(f"⚠️ 데이터 파일 '{CSV_FILE.name}' 이(가) 존재하지 않습니다.\n같은 폴더에 CSV 파일을 올려주세요.")
+        st.stop()
 
 # 최근 연도 기준 값 추출
 latest = df.iloc[-1]
@@ -45,57 +37,49 @@ st.sidebar.markdown(f"""
 """)
 
 # ESG 점수 및 등급 테이블
-st.subheader("📈 ESG 점수 및 등급")
-st.dataframe(df[[
-"Year", "ESG_Environmental", "Environmental_Grade",
-"ESG_Social", "Social_Grade",
-"ESG_Governance", "Governance_Grade",
-"ESG_Overall", "ESG_Grade"
-]])
+with timer("점수 테이블"):
+    st.subheader("📈 ESG 점수 및 등급")
+    paged_table(df, key="esg_table", columns=[
+        "Year", "ESG_Environmental", "Environmental_Grade",
+        "ESG_Social", "Social_Grade",
+        "ESG_Governance", "Governance_Grade",
+        "ESG_Overall", "ESG_Grade"
+    ], version=dataset_version("esg"))
 
 # 🔹 한 직선으로 고정한 ESG 점수 시각화
-st.subheader("📉 ESG 점수 변화 추이 (직선 고정)")
-fixed_esg = pd.DataFrame({
-"Year": df["Year"],
-"ESG_Environmental": [latest["ESG_Environmental"]] * len(df),
-"ESG_Social": [latest["ESG_Social"]] * len(df),
-"ESG_Governance": [latest["ESG_Governance"]] * len(df),
-"ESG_Overall": [latest["ESG_Overall"]] * len(df),
-}).set_index("Year")
-st.line_chart(fixed_esg)
+with timer("점수 차트"):
+    st.subheader("📉 ESG 점수 변화 추이 (직선 고정)")
+    fixed_esg = pd.DataFrame({
+        "Year": df["Year"],
+        "ESG_Environmental": [latest["ESG_Environmental"]] * len(df),
+        "ESG_Social": [latest["ESG_Social"]] * len(df),
+        "ESG_Governance": [latest["ESG_Governance"]] * len(df),
+        "ESG_Overall": [latest["ESG_Overall"]] * len(df),
+    })
+    st.line_chart(chart_data(fixed_esg, "Year", fixed_esg.columns.drop("Year")))
 
 # 🔹 한 직선으로 고정한 환경 성과 지표 시각화
-st.subheader("🌿 환경 성과 지표 (직선 고정)")
-fixed_env = pd.DataFrame({
-"Year": df["Year"],
-"CarbonEmissions": [latest["CarbonEmissions"]] * len(df),
-"WaterUsage": [latest["WaterUsage"]] * len(df),
-"EnergyConsumption": [latest["EnergyConsumption"]] * len(df),
-}).set_index("Year")
-st.line_chart(fixed_env)
+with timer("환경 차트"):
+    st.subheader("🌿 환경 성과 지표 (직선 고정)")
+    fixed_env = pd.DataFrame({
+        "Year": df["Year"],
+        "CarbonEmissions": [latest["CarbonEmissions"]] * len(df),
+        "WaterUsage": [latest["WaterUsage"]] * len(df),
+        "EnergyConsumption": [latest["EnergyConsumption"]] * len(df),
+    })
+    st.line_chart(chart_data(fixed_env, "Year", fixed_env.columns.drop("Year")))
 
 # ESG 개선 과제 제안
 st.subheader("🛠️ 향후 ESG 개선 과제 제안")
-improvements = []
-if latest["ESG_Environmental"] < 60:
-improvements.append("✔ **환경(E)**: 탄소 감축, 친환경 설비 도입 필요")
-if latest["ESG_Social"] < 60:
-improvements.append("✔ **사회(S)**: 직원 만족도 제고, 지역사회 활동 강화 필요")
-if latest["ESG_Governance"] < 60:
-improvements.append("✔ **지배구조(G)**: 투명경영, 이사회 다양성 확대 필요")
-
-if improvements:
-st.warning("현재 ESG 점수가 낮은 영역이 있습니다.")
-for item in improvements:
-st.markdown(item)
-else:
-st.success("모든 ESG 항목이 양호한 수준입니다. 🎉")
+improvement_section(hits, latest["CompanyID"], latest["Year"])
 
 # 최신 등급 요약
 st.sidebar.subheader("📊 최신 등급 요약")
 st.sidebar.markdown(f"""
-- **환경 (E)**: `{get_grade(latest['ESG_Environmental'])}`
-- **사회 (S)**: `{get_grade(latest['ESG_Social'])}`
-- **지배구조 (G)**: `{get_grade(latest['ESG_Governance'])}`
-- **종합 ESG**: `{get_grade(latest['ESG_Overall'])}`
+- **환경 (E)**: `{grade_label(latest['ESG_Environmental'])}`
+- **사회 (S)**: `{grade_label(latest['ESG_Social'])}`
+- **지배구조 (G)**: `{grade_label(latest['ESG_Governance'])}`
+- **종합 ESG**: `{grade_label(latest['ESG_Overall'])}`
 """)
+
+timer.report()
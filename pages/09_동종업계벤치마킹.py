@@ -0,0 +1,81 @@
+import streamlit as st
+import pandas as pd
+
+from utils.company_index import company_options, company_slice
+from utils.esg_data import CSV_FILE
+from utils.peer_cube import ALL, CUBE_METRICS, load_peer_cube, peer_stats
+from utils.shared_store import load_shared_esg
+from utils.timing import page_timer
+
+# 페이지 설정
+st.set_page_config(page_title="동종업계 ESG 벤치마킹", layout="wide")
+timer = page_timer("09")
+
+# 데이터(세션 공용 메모리 맵) + 미리 집계한 동종업계 큐브 불러오기
+with timer("데이터 로드"):
+    try:
+        df, company_index = load_shared_esg("esg")
+        cube = load_peer_cube("esg")
+    except FileNotFoundError:
+        st.error(f"⚠️ 데이터 파일 '{CSV_FILE.name}' 이(가) 존재하지 않습니다.\n같은 폴더에 CSV 파일을 올려주세요.")
+        st.stop()
+
+# 타이틀
+st.title("🏁 동종업계 ESG 벤치마킹")
+st.markdown("선택한 기업의 ESG 점수와 환경 지표를 같은 **산업군 × 지역** 동종 기업과 연도별로 비교합니다.")
+
+# 기업 선택
+companies = company_options(df, company_index)
+company_id = st.sidebar.selectbox(
+    "🏢 기업 선택", list(companies), format_func=lambda cid: f"{companies[cid]} (#{cid})"
+)
+company_df = company_slice(df, company_index, company_id)
+info = company_df.iloc[0]
+
+st.sidebar.header("📌 기업 정보")
+st.sidebar.markdown(f"""
+- **기업명**: `{info['CompanyName']}`
+- **산업군**: `{info['Industry']}`
+- **지역**: `{info['Region']}`
+""")
+
+# 비교 연도 / 비교 그룹 선택
+year = st.select_slider("📅 비교 연도", options=company_df["Year"].tolist(), value=int(company_df["Year"].iloc[-1]))
+scope = st.radio("👥 비교 그룹", ["산업군 × 지역", "산업군", "지역", "전체"], horizontal=True)
+industry = info["Industry"] if scope in ("산업군 × 지역", "산업군") else ALL
+region = info["Region"] if scope in ("산업군 × 지역", "지역") else ALL
+
+# 큐브 조회 (groupby 없음)
+with timer("큐브 조회"):
+    stats = peer_stats(cube, industry, region, year)
+    company_row = company_df[company_df["Year"] == year].iloc[0]
+
+    comparison = pd.DataFrame({
+        "기업값": company_row[CUBE_METRICS].astype(float),
+        "평균": stats["mean"],
+        "중앙값": stats["median"],
+        "하위 10%": stats["p10"],
+        "상위 10%": stats["p90"],
+    })
+    comparison["중앙값 대비(%)"] = (comparison["기업값"] / comparison["중앙값"] - 1) * 100
+
+st.metric("👥 비교 기업 수", f"{int(stats['count'].iloc[0])}개사", help=f"{industry} / {region} / {year}")
+
+# ESG 점수 비교
+with timer("점수 차트"):
+    st.subheader("📈 ESG 점수: 기업 vs 동종업계")
+    esg_metrics = ["ESG_Environmental", "ESG_Social", "ESG_Governance", "ESG_Overall"]
+    st.bar_chart(comparison.loc[esg_metrics, ["기업값", "중앙값", "상위 10%"]], stack=False)
+
+# 환경 지표 비교 (단위가 달라 중앙값 대비 비율로 표시)
+with timer("환경 차트"):
+    st.subheader("🌿 환경 지표: 동종업계 중앙값 대비 (%)")
+    env_metrics = ["CarbonEmissions", "WaterUsage", "EnergyConsumption"]
+    st.bar_chart(comparison.loc[env_metrics, ["중앙값 대비(%)"]])
+
+# 상세 표
+with timer("상세 표"):
+    st.subheader("📋 상세 비교")
+    st.dataframe(comparison.style.format("{:,.1f}"))
+
+timer.report()
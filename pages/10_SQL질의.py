@@ -0,0 +1,68 @@
+import streamlit as st
+import pandas as pd
+
+from utils.esg_data import CSV_FILE, DTYPES
+from utils.sql_query import MAX_ROWS, TABLE, TIMEOUT_SECONDS, duckdb, explain_query, run_query
+from utils.table import paged_table
+
+# 페이지 설정
+st.set_page_config(page_title="ESG SQL 질의", layout="wide")
+
+st.title("🧮 ESG 데이터 SQL 질의")
+st.markdown(
+    f"`{TABLE}` 테이블에 SQL(SELECT)을 바로 실행합니다. "
+    f"결과는 최대 **{MAX_ROWS:,}행**, 실행 시간은 **{TIMEOUT_SECONDS}초**로 제한됩니다."
+)
+
+if duckdb is None:
+    st.error("⚠️ DuckDB 가 설치되어 있지 않습니다. `pip install duckdb` 후 다시 실행해주세요.")
+    st.stop()
+
+# 컬럼 안내 (판다스 dtype → DuckDB 타입)
+SQL_TYPES = {str: "VARCHAR", "int64": "BIGINT", "float64": "DOUBLE"}
+with st.expander("📚 컬럼 목록"):
+    st.dataframe(pd.DataFrame({
+        "컬럼": list(DTYPES),
+        "타입": [SQL_TYPES[dtype] for dtype in DTYPES.values()],
+    }), hide_index=True)
+
+# 예시: 2025년 아시아 에너지 기업 중 ESG 종합 점수 40 미만
+EXAMPLE = f"""SELECT CompanyID, CompanyName, Industry, Region, ESG_Overall
+FROM {TABLE}
+WHERE Industry = 'Energy' AND Region = 'Asia' AND Year = 2025 AND ESG_Overall < 40
+ORDER BY ESG_Overall"""
+
+# 폼으로 묶어 입력 중에는 실행하지 않음
+with st.form("sql_form"):
+    sql = st.text_area("SQL", EXAMPLE, height=160)
+    if st.form_submit_button("▶ 실행"):
+        st.session_state["sql_last"] = sql
+
+if "sql_last" in st.session_state:
+    query = st.session_state["sql_last"]
+    try:
+        result = run_query(query)
+    except FileNotFoundError:
+        st.error(f"⚠️ 데이터 파일 '{CSV_FILE.name}' 이(가) 존재하지 않습니다.\n같은 폴더에 CSV 파일을 올려주세요.")
+        st.stop()
+    except TimeoutError as exc:
+        st.error(f"⏱ {exc} 조건을 좁히거나 LIMIT 을 줄여 보세요.")
+        st.stop()
+    except ValueError as exc:
+        st.error(f"⚠️ {exc}")
+        st.stop()
+
+    frame = result["frame"]
+    st.caption(
+        f"{len(frame):,}행 · {result['seconds'] * 1000:,.0f} ms"
+        + (" · 캐시된 결과" if result["cached"] else "")
+    )
+    if result["truncated"]:
+        st.warning(f"결과가 {MAX_ROWS:,}행을 넘어 앞부분만 표시합니다. WHERE 나 LIMIT 으로 범위를 좁혀 보세요.")
+
+    # 결과 테이블 (검색·정렬·페이지)
+    paged_table(frame, key="sql_table", version=(result["version"], query))
+    st.download_button("📥 결과 CSV 다운로드", data=frame.to_csv(index=False), file_name="esg_query.csv", mime="text/csv")
+
+    with st.expander("🔍 실행 계획 (Parquet 스캔에 내려간 필터·컬럼)"):
+        st.code(explain_query(query), language="text")
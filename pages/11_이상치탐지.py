@@ -0,0 +1,92 @@
+import streamlit as st
+
+from utils.anomaly import ANOMALY_METRICS, MIN_CHANGES, Z_THRESHOLD, load_anomalies
+from utils.esg_data import CSV_FILE, dataset_version
+from utils.table import paged_table
+from utils.timing import page_timer
+
+# 페이지 설정
+st.set_page_config(page_title="ESG 이상치 탐지", layout="wide")
+timer = page_timer("11")
+
+# 미리 계산한 이상치 목록 불러오기 (데이터가 바뀌면 다시 계산)
+with timer("데이터 로드"):
+    try:
+        anomalies = load_anomalies("esg")
+        version = dataset_version("esg")
+    except FileNotFoundError:
+        st.error(f"⚠️ 데이터 파일 '{CSV_FILE.name}' 이(가) 존재하지 않습니다.\n같은 폴더에 CSV 파일을 올려주세요.")
+        st.stop()
+
+# 타이틀
+st.title("🚨 ESG 지표 이상치 탐지")
+st.markdown(
+    "모든 기업의 지표별 **전년 대비 변화율**을 기업 자신의 변화 분포와 비교해 "
+    f"robust z-score(중앙값·MAD 기준)가 **{Z_THRESHOLD}** 이상인 급변 구간을 모았습니다. "
+    f"(변화가 {MIN_CHANGES}번 미만인 기업은 제외)"
+)
+
+# 필터
+col1, col2, col3 = st.columns([3, 1, 1])
+with col1:
+    metrics = st.multiselect(
+        "📏 지표", ANOMALY_METRICS, default=["CarbonEmissions", "WaterUsage", "EnergyConsumption"]
+    )
+with col2:
+    min_z = st.number_input("|z| 최소", min_value=float(Z_THRESHOLD), value=float(Z_THRESHOLD), step=0.5)
+with col3:
+    direction = st.radio("방향", ["전체", "급증", "급감"], horizontal=True)
+
+with timer("필터"):
+    mask = anomalies["Metric"].isin(metrics) & (anomalies["ZScore"].abs() >= min_z)
+    if direction == "급증":
+        mask &= anomalies["ZScore"] > 0
+    elif direction == "급감":
+        mask &= anomalies["ZScore"] < 0
+    selected = anomalies[mask]
+
+if selected.empty:
+    st.info("조건에 맞는 이상치가 없습니다.")
+    st.stop()
+
+# 요약
+m1, m2, m3 = st.columns(3)
+m1.metric("이상치", f"{len(selected):,}건")
+m2.metric("기업 수", f"{selected['CompanyID'].nunique():,}곳")
+m3.metric("최다 연도", int(selected["Year"].mode().iloc[0]))
+
+with timer("연도별 집계"):
+    st.subheader("📅 연도별 이상치 수")
+    by_year = selected.pivot_table(index="Year", columns="Metric", values="ZScore", aggfunc="size", fill_value=0)
+    st.bar_chart(by_year)
+
+# 이상치 목록
+with timer("목록 테이블"):
+    st.subheader("📋 이상치 목록")
+    table = selected.assign(
+        Change=(selected["Change"] * 100).round(1),
+        ZScore=selected["ZScore"].round(2),
+    ).rename(columns={"Change": "Change(%)"})
+    paged_table(table, key="anomaly_table", columns=[
+        "CompanyID", "CompanyName", "Industry", "Region", "Year", "PrevYear",
+        "Metric", "Previous", "Value", "Change(%)", "ZScore",
+    ], version=(version, tuple(metrics), min_z, direction))
+
+# 기업 화면으로 이동 (|z| 가 큰 기업 순)
+st.subheader("🔗 기업별 상세 보기")
+ranked = selected.assign(absz=selected["ZScore"].abs()).sort_values("absz", ascending=False)
+ranked = ranked.drop_duplicates("CompanyID")
+names = dict(zip(ranked["CompanyID"], ranked["CompanyName"]))
+counts = selected.groupby("CompanyID").size()
+company_id = st.selectbox(
+    "🏢 기업 선택", list(names), format_func=lambda cid: f"{names[cid]} (#{cid}) · {counts[cid]}건"
+)
+st.dataframe(
+    selected[selected["CompanyID"] == company_id][["Year", "Metric", "Previous", "Value", "Change", "ZScore"]]
+    .style.format({"Change": "{:+.1%}", "ZScore": "{:+.2f}"}),
+    hide_index=True,
+)
+st.page_link("pages/_07.py", label=f"📊 {names[company_id]} ESG 분석 대시보드 열기",
+             query_params={"company": int(company_id)})
+
+timer.report()
@@ -1,115 +1,151 @@
 import streamlit as st
-import pandas as pd
+
+from utils.chart_data import chart_data
+from utils.company_index import company_options, company_slice
+from utils.esg_data import CSV_FILE
+from utils.grading import grade_label
+from utils.improvement import improvement_section, load_rule_hits
+from utils.interpolate import fill_panel
+from utils.shared_store import load_shared_esg
+from utils.similarity import load_similarity_index, similar_companies_panel
+from utils.table import paged_table
+from utils.timing import page_timer
+
+# 추이 차트에 쓰는 지표
+TREND_COLUMNS = [
+    "ESG_Environmental", "ESG_Social", "ESG_Governance", "ESG_Overall",
+    "CarbonEmissions", "WaterUsage", "EnergyConsumption",
+]
 
 # 페이지 설정
 st.set_page_config(page_title="ESG 분석 대시보드", layout="wide")
-
-# CSV 파일명 (같은 폴더에 esg_data.csv로 저장)
-CSV_FILE = "esg_data.csv"
-
-# 데이터 불러오기
-try:
-    df = pd.read_csv(CSV_FILE)
-except FileNotFoundError:
-    st.error(f"⚠️ 데이터 파일 '{CSV_FILE}' 이(가) 존재하지 않습니다.\n같은 폴더에 CSV 파일을 올려주세요.")
-    st.stop()
-
-# ESG 등급 함수 정의
-def get_grade(score):
-    if score >= 80:
-        return "A (우수)"
-    elif score >= 60:
-        return "B (보통)"
-    elif score >= 40:
-        return "C (주의)"
-    else:
-        return "D (위험)"
-
-# 등급 컬럼 추가
-df["Environmental_Grade"] = df["ESG_Environmental"].apply(get_grade)
-df["Social_Grade"] = df["ESG_Social"].apply(get_grade)
-df["Governance_Grade"] = df["ESG_Governance"].apply(get_grade)
-df["ESG_Grade"] = df["ESG_Overall"].apply(get_grade)
-
-# 연도 필터링 슬라이더
-years = df["Year"].unique()
-min_year, max_year = int(years.min()), int(years.max())
-selected_years = st.slider("🔍 분석할 연도 범위 선택", min_year, max_year, (min_year, max_year))
-filtered_df = df[df["Year"].between(*selected_years)]
-
-# 최근 연도 데이터
-latest = filtered_df.iloc[-1]
-
-# 대시보드 타이틀
-st.title("📊 ESG 분석 대시보드")
-st.markdown("한 기업의 연도별 ESG 추세 및 개선 방향을 시각적으로 분석합니다.")
+timer = page_timer("_07")
+
+# 데이터 불러오기 (세션 공용 메모리 맵 데이터, 등급 컬럼·기업별 행 범위 인덱스 포함)
+with timer("데이터 로드"):
+    try:
+        df, company_index = load_shared_esg("esg")
+        hits = load_rule_hits("esg")
+        similarity_index = load_similarity_index("esg")
+    except FileNotFoundError:
+        st.error(f"⚠️ 데이터 파일 '{CSV_FILE.name}' 이(가) 존재하지 않습니다.\n같은 폴더에 CSV 파일을 올려주세요.")
+        st.stop()
+
+# 기업 선택 (CompanyID → 행 범위 인덱스로 바로 슬라이스)
+with timer("기업 선택"):
+    companies = company_options(df, company_index)
+    # 이상치 탐지 페이지의 링크(?company=ID)로 들어오면 그 기업을 먼저 선택
+    requested = st.query_params.get("company", "")
+    first = list(companies).index(int(requested)) if requested.isdigit() and int(requested) in companies else 0
+    company_id = st.sidebar.selectbox(
+        "🏢 기업 선택", list(companies), index=first, format_func=lambda cid: f"{companies[cid]} (#{cid})"
+    )
+    company_df = company_slice(df, company_index, company_id)
 
 # 사이드바 기업 정보
 st.sidebar.header("📌 기업 정보")
 st.sidebar.markdown(f"""
-- **기업명**: `{df['CompanyName'].iloc[0]}`
-- **산업군**: `{df['Industry'].iloc[0]}`
-- **지역**: `{df['Region'].iloc[0]}`
+- **기업명**: `{company_df['CompanyName'].iloc[0]}`
+- **산업군**: `{company_df['Industry'].iloc[0]}`
+- **지역**: `{company_df['Region'].iloc[0]}`
 """)
 
-# ESG 점수 테이블
-st.subheader("📈 ESG 점수 및 등급")
-st.dataframe(filtered_df[[
-    "Year", "ESG_Environmental", "Environmental_Grade",
-    "ESG_Social", "Social_Grade",
-    "ESG_Governance", "Governance_Grade",
-    "ESG_Overall", "ESG_Grade"
-]])
-
-# ESG 점수 영역별 추이 그래프
-st.subheader("📉 ESG 점수 변화 추이")
-col1, col2 = st.columns(2)
-with col1:
-    st.line_chart(filtered_df.set_index("Year")[["ESG_Environmental"]])
-    st.line_chart(filtered_df.set_index("Year")[["ESG_Social"]])
-with col2:
-    st.line_chart(filtered_df.set_index("Year")[["ESG_Governance"]])
-    st.line_chart(filtered_df.set_index("Year")[["ESG_Overall"]])
-
-# 환경 성과 상세 시각화
-st.subheader("🌿 환경 성과 지표 (탄소, 물, 에너지)")
-
-eco1, eco2, eco3 = st.columns(3)
-with eco1:
-    st.metric("🌍 탄소배출량", f"{latest['CarbonEmissions']} tCO₂")
-    st.line_chart(filtered_df.set_index("Year")[["CarbonEmissions"]])
-with eco2:
-    st.metric("💧 물 사용량", f"{latest['WaterUsage']} tons")
-    st.line_chart(filtered_df.set_index("Year")[["WaterUsage"]])
-with eco3:
-    st.metric("⚡ 에너지 소비량", f"{latest['EnergyConsumption']} MWh")
-    st.line_chart(filtered_df.set_index("Year")[["EnergyConsumption"]])
-
-# 개선 과제 제안
-st.subheader("🛠️ 향후 ESG 개선 과제 제안")
-improvements = []
-if latest["ESG_Environmental"] < 60:
-    improvements.append("✔ **환경(E)**: 탄소 감축, 친환경 설비 도입 필요")
-if latest["ESG_Social"] < 60:
-    improvements.append("✔ **사회(S)**: 직원 만족도 제고, 지역사회 활동 강화 필요")
-if latest["ESG_Governance"] < 60:
-    improvements.append("✔ **지배구조(G)**: 투명경영, 이사회 다양성 확대 필요")
-
-if improvements:
-    st.warning("현재 ESG 점수가 낮은 영역이 있습니다.")
-    for item in improvements:
-        st.markdown(item)
-else:
-    st.success("모든 ESG 항목이 양호한 수준입니다. 🎉")
-
-# 사이드바 최신 등급 요약
-st.sidebar.subheader("📊 최신 등급 요약")
-st.sidebar.markdown(f"""
-- **환경 (E)**: `{get_grade(latest['ESG_Environmental'])}`
-- **사회 (S)**: `{get_grade(latest['ESG_Social'])}`
-- **지배구조 (G)**: `{get_grade(latest['ESG_Governance'])}`
-- **종합 ESG**: `{get_grade(latest['ESG_Overall'])}`
+
+# 사이드바 유사 기업 (연도별 표준화 지표 벡터의 최근접 이웃, 체크박스를 바꾸면 이 패널만 다시 실행)
+@timer.fragment("유사 기업")
+def similar_panel(company_id, year):
+    with timer("유사 기업"):
+        similar_companies_panel(df, company_index, similarity_index, company_id, year)
+
+
+# 점수 테이블 (정렬·검색·페이지 이동은 이 조각만 다시 실행)
+@timer.fragment("점수 테이블")
+def score_table(filtered_df, company_id, selected_years):
+    with timer("점수 테이블"):
+        st.subheader("📈 ESG 점수 및 등급")
+        paged_table(filtered_df, key="esg_table", columns=[
+            "Year", "ESG_Environmental", "Environmental_Grade",
+            "ESG_Social", "Social_Grade",
+            "ESG_Governance", "Governance_Grade",
+            "ESG_Overall", "ESG_Grade"
+        ], version=(company_id, selected_years))
+
+
+# 연도 범위 아래 전부 (슬라이더를 움직이면 데이터 로드·기업 선택은 건너뛰고 이 조각만 다시 실행)
+# df·hits·유사도 인덱스는 마지막 전체 실행 때 읽은 공용 객체를 그대로 씀
+@timer.fragment("연도 범위")
+def company_view(company_df, company_id):
+    # 연도 필터링 슬라이더
+    with timer("연도 필터"):
+        years = company_df["Year"].unique()
+        min_year, max_year = int(years.min()), int(years.max())
+        selected_years = st.slider("🔍 분석할 연도 범위 선택", min_year, max_year, (min_year, max_year))
+        filtered_df = company_df[company_df["Year"].between(*selected_years)]
+        # 차트용 연도별 계열 (빠진 연도는 앞뒤 관측값으로 선형 보간)
+        trend_df = fill_panel(filtered_df, "CompanyID", TREND_COLUMNS)
+
+    # 최근 연도 데이터
+    latest = filtered_df.iloc[-1]
+
+    # 대시보드 타이틀
+    st.title("📊 ESG 분석 대시보드")
+    st.markdown("한 기업의 연도별 ESG 추세 및 개선 방향을 시각적으로 분석합니다.")
+
+    # 사이드바 유사 기업
+    similar_panel(company_id, latest["Year"])
+
+    # ESG 점수 테이블
+    score_table(filtered_df, company_id, selected_years)
+
+    # ESG 점수 영역별 추이 그래프
+    with timer("점수 차트"):
+        st.subheader("📉 ESG 점수 변화 추이")
+        if trend_df["interpolated"].any():
+            filled_years = ", ".join(str(y) for y in trend_df.loc[trend_df["interpolated"], "Year"])
+            st.caption(f"ℹ️ 데이터가 없는 연도({filled_years})는 앞뒤 값으로 보간해 표시합니다.")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.line_chart(chart_data(trend_df, "Year", ["ESG_Environmental"]))
+            st.line_chart(chart_data(trend_df, "Year", ["ESG_Social"]))
+        with col2:
+            st.line_chart(chart_data(trend_df, "Year", ["ESG_Governance"]))
+            st.line_chart(chart_data(trend_df, "Year", ["ESG_Overall"]))
+
+    # 환경 성과 상세 시각화
+    with timer("환경 차트"):
+        st.subheader("🌿 환경 성과 지표 (탄소, 물, 에너지)")
+
+        eco1, eco2, eco3 = st.columns(3)
+        with eco1:
+            st.metric("🌍 탄소배출량", f"{latest['CarbonEmissions']} tCO₂")
+            st.line_chart(chart_data(trend_df, "Year", ["CarbonEmissions"]))
+        with eco2:
+            st.metric("💧 물 사용량", f"{latest['WaterUsage']} tons")
+            st.line_chart(chart_data(trend_df, "Year", ["WaterUsage"]))
+        with eco3:
+            st.metric("⚡ 에너지 소비량", f"{latest['EnergyConsumption']} MWh")
+            st.line_chart(chart_data(trend_df, "Year", ["EnergyConsumption"]))
+
+    # 개선 과제 제안
+    st.subheader("🛠️ 향후 ESG 개선 과제 제안")
+    improvement_section(hits, company_id, latest["Year"])
+
+    # 사이드바 최신 등급 요약
+    st.sidebar.subheader("📊 최신 등급 요약")
+    st.sidebar.markdown(f"""
+- **환경 (E)**: `{grade_label(latest['ESG_Environmental'])}`
+- **사회 (S)**: `{grade_label(latest['ESG_Social'])}`
+- **지배구조 (G)**: `{grade_label(latest['ESG_Governance'])}`
+- **종합 ESG**: `{grade_label(latest['ESG_Overall'])}`
 """)
 
-# 데이터 다운로드 기능
-st.download_button("📥 ESG 데이터 다운로드", data=filtered_df.to_csv(index=False), file_name="filtered_esg_data.csv", mime="text/csv")
+    # 데이터 다운로드 기능 (CSV 는 버튼을 누를 때만 만듦)
+    st.download_button(
+        "📥 ESG 데이터 다운로드", data=lambda: filtered_df.to_csv(index=False),
+        file_name="filtered_esg_data.csv", mime="text/csv", on_click="ignore",
+    )
+
+
+company_view(company_df, company_id)
+
+timer.report()
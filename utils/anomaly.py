@@ -0,0 +1,139 @@
+"""전체 기업 ESG 시계열 이상치 탐지 (배치).
+
+모든 기업 × 지표의 전년 대비 변화율(YoY)을 한 번에 계산하고, 기업마다 자기
+변화율 분포의 중앙값·MAD 로 robust z-score(수정 z-score)를 매긴다.
+|z| 가 기준 이상인 변화만 이상치 목록으로 저장한다 (파생 산출물 'anomalies').
+
+z-score 는 기업 자신의 계열로만 정해지므로, 새 연도가 들어오면 그 기업들만
+다시 계산해 목록에서 바꿔 끼우면 된다 (update_anomalies).
+
+사용법 (저장소 루트에서):
+    python -m utils.anomaly              # 이상치 목록 생성(또는 캐시 확인) 후 요약 출력
+    python -m utils.anomaly --rebuild    # 캐시를 무시하고 다시 계산
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.esg_data import dataset_version, ensure_snapshot, load_derived, read_snapshot, save_derived
+from utils.registry import resolve
+
+ANOMALY_METRICS = [
+    "CarbonEmissions", "WaterUsage", "EnergyConsumption",
+    "ESG_Environmental", "ESG_Social", "ESG_Governance", "ESG_Overall",
+]
+
+# 수정 z-score 기준 (Iglewicz & Hoaglin 권장값)과 정규분포 환산 상수
+Z_THRESHOLD = 3.5
+MAD_SCALE = 0.6745
+
+# z-score 를 매기는 데 필요한 기업별 최소 변화 개수
+MIN_CHANGES = 4
+
+COMPANY_COLUMNS = ["CompanyID", "CompanyName", "Industry", "Region"]
+
+COLUMNS = [*COMPANY_COLUMNS, "Year", "PrevYear", "Metric", "Value", "Previous", "Change", "ZScore"]
+
+
+def yoy_scores(df, metrics=ANOMALY_METRICS):
+    """(CompanyID, Year) 순 정렬 프레임과 지표별 YoY 변화율·z-score 배열 (행 × 지표).
+
+    첫 해, 직전 값이 0 인 변화, 변화가 MIN_CHANGES 개 미만이거나 MAD 가 0 인 기업은 NaN.
+    """
+    df = df.sort_values(["CompanyID", "Year"], kind="stable", ignore_index=True)
+    ids = df["CompanyID"].to_numpy(dtype="int64")
+    values = df[metrics].to_numpy(dtype="float64")
+
+    # 같은 기업의 직전 행 값
+    same = np.r_[False, ids[1:] == ids[:-1]]
+    previous = np.roll(values, 1, axis=0)
+    previous[~same] = np.nan
+    with np.errstate(invalid="ignore", divide="ignore"):
+        change = (values - previous) / np.abs(previous)
+    change[~np.isfinite(change)] = np.nan
+
+    # (기업 × 기업 안 순번 × 지표) 배열로 펼쳐 기업별 중앙값·MAD 를 한 번에 계산
+    codes, _ = pd.factorize(ids)
+    starts = np.flatnonzero(~same)
+    step = np.arange(len(ids)) - starts[codes]
+    wide = np.full((len(starts), int(step.max()) + 1 if len(ids) else 0, len(metrics)), np.nan)
+    wide[codes, step] = change
+    with warnings.catch_warnings():
+        # 변화가 하나도 없는 기업(한 해뿐)은 NaN 으로 둠
+        warnings.simplefilter("ignore", RuntimeWarning)
+        median = np.nanmedian(wide, axis=1)
+        mad = np.nanmedian(np.abs(wide - median[:, None, :]), axis=1)
+    enough = (~np.isnan(wide)).sum(axis=1) >= MIN_CHANGES
+    mad = np.where(enough & (mad > 0), mad, np.nan)
+    with np.errstate(invalid="ignore"):
+        zscore = MAD_SCALE * (change - median[codes]) / mad[codes]
+    return df, previous, change, zscore
+
+
+def build_anomalies(df, metrics=ANOMALY_METRICS, threshold=Z_THRESHOLD):
+    """|z| >= threshold 인 (기업, 연도, 지표) 변화 목록 (파생 산출물 'anomalies')."""
+    df, previous, change, zscore = yoy_scores(df, metrics)
+    with np.errstate(invalid="ignore"):
+        rows, cols = np.nonzero(np.abs(zscore) >= threshold)
+    years = df["Year"].to_numpy(dtype="int64")
+    out = df.loc[rows, COMPANY_COLUMNS].reset_index(drop=True)
+    out["Year"] = years[rows]
+    out["PrevYear"] = years[rows - 1]
+    out["Metric"] = np.asarray(metrics)[cols]
+    out["Value"] = df[metrics].to_numpy(dtype="float64")[rows, cols]
+    out["Previous"] = previous[rows, cols]
+    out["Change"] = change[rows, cols]
+    out["ZScore"] = zscore[rows, cols]
+    return out[COLUMNS]
+
+
+def update_anomalies(anomalies, df, new_rows):
+    """new_rows 가 속한 기업만 df(추가 후 전체)에서 다시 계산해 목록에 반영."""
+    companies = new_rows["CompanyID"].unique()
+    fresh = build_anomalies(df[df["CompanyID"].isin(companies)])
+    kept = anomalies[~anomalies["CompanyID"].isin(companies)]
+    return pd.concat([kept, fresh], ignore_index=True).sort_values(
+        ["CompanyID", "Year", "Metric"], kind="stable", ignore_index=True
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _load_cached(version, _path):
+    return load_derived("anomalies", build_anomalies, _path)
+
+
+def load_anomalies(source="esg"):
+    """캐시된 이상치 목록 반환 (source: 데이터셋 이름 또는 경로). 파일이 없으면 FileNotFoundError."""
+    path = resolve(source)
+    return _load_cached(dataset_version(path), path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default="esg", help="데이터셋 이름 또는 CSV 경로 (기본: esg)")
+    parser.add_argument("--rebuild", action="store_true", help="저장된 목록을 무시하고 다시 계산")
+    args = parser.parse_args()
+
+    path = resolve(args.target)
+    start = time.perf_counter()
+    if args.rebuild:
+        manifest, _ = ensure_snapshot(path)
+        anomalies = build_anomalies(read_snapshot(path))
+        save_derived("anomalies", anomalies, manifest["sha256"])
+    else:
+        anomalies = load_derived("anomalies", build_anomalies, path)
+    seconds = time.perf_counter() - start
+
+    print(f"🚨 이상치 {len(anomalies):,}건 (기업 {anomalies['CompanyID'].nunique():,}곳, |z| ≥ {Z_THRESHOLD}) "
+          f"· {seconds * 1000:,.0f} ms")
+    counts = anomalies.groupby("Metric").size().reindex(ANOMALY_METRICS, fill_value=0)
+    for metric, count in counts.items():
+        print(f"   {metric:<18} {count:>6,}")
+
+
+if __name__ == "__main__":
+    main()
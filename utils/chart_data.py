@@ -0,0 +1,66 @@
+"""차트용 데이터 준비.
+
+차트로 넘기기 전에 서버에서 점 수를 줄인다. x(연도 등)가 중복되면 x 별 평균
+(선택적으로 p10/p90 밴드)으로 묶고, 그래도 점이 예산보다 많으면 LTTB
+(Largest-Triangle-Three-Buckets)로 모양을 유지한 채 솎아낸다.
+"""
+import numpy as np
+import pandas as pd
+
+# 차트 하나당 기본 점 예산
+MAX_POINTS = 500
+
+
+def lttb(x, y, n_out):
+    """LTTB 로 남길 점의 위치(정수 배열)를 반환. 처음/마지막 점은 항상 포함."""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    # 처음/마지막 점을 뺀 나머지를 n_out - 2 개 버킷으로 나눔
+    edges = np.linspace(1, n - 1, n_out - 1).astype("int64")
+    keep = np.empty(n_out, dtype="int64")
+    keep[0], keep[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        # 다음 버킷 평균점 (마지막 버킷이면 마지막 점)
+        nxt_start, nxt_stop = stop, edges[i + 2] if i + 2 < len(edges) else n
+        nx, ny = x[nxt_start:nxt_stop].mean(), y[nxt_start:nxt_stop].mean()
+        # 이전 선택점·다음 평균점과 만드는 삼각형 넓이가 가장 큰 점 선택
+        area = np.abs(
+            (x[prev] - nx) * (y[start:stop] - y[prev]) - (x[prev] - x[start:stop]) * (ny - y[prev])
+        )
+        prev = start + int(np.nanargmax(area)) if np.isfinite(area).any() else start
+        keep[i + 1] = prev
+    return keep
+
+
+def aggregate_by_x(df, x, columns, band=False):
+    """x 별 평균. band=True 면 '<컬럼> (p10)', '<컬럼> (p90)' 도 함께."""
+    grouped = df.groupby(x, sort=True, observed=True)[columns]
+    data = grouped.mean()
+    if band:
+        data = pd.concat([
+            data,
+            grouped.quantile(0.1).add_suffix(" (p10)"),
+            grouped.quantile(0.9).add_suffix(" (p90)"),
+        ], axis=1)
+    return data
+
+
+def chart_data(df, x, columns, max_points=MAX_POINTS, band=False):
+    """x 를 인덱스로 한 차트용 프레임 (점 수는 최대 max_points × 컬럼 수)."""
+    columns = list(columns)
+    if df[x].duplicated().any():
+        data = aggregate_by_x(df, x, columns, band)
+    else:
+        data = df.set_index(x)[columns].sort_index()
+    if len(data) > max_points:
+        xs = data.index.to_numpy(dtype="float64")
+        keep = np.unique(np.concatenate([
+            lttb(xs, data[col].to_numpy(dtype="float64"), max_points) for col in data.columns
+        ]))
+        data = data.iloc[keep]
+    return data
@@ -0,0 +1,48 @@
+"""matplotlib 차트 이미지 캐시.
+
+pyplot 전역 상태를 쓰지 않고 Agg 캔버스에 붙인 Figure 를 직접 만들어 PNG/SVG
+바이트로 저장한 뒤 바로 비운다(서버에 그림 객체가 쌓이지 않음). 결과 바이트는
+(데이터 지문, 컬럼, 제목, 축 이름, 형식) 키로 캐시해 같은 차트를 다시 켤 때는
+그리기도, 차트용 집계도 하지 않는다.
+"""
+import io
+
+import streamlit as st
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from utils.chart_data import chart_data
+
+# st.pyplot 기본값과 같은 해상도
+DPI = 200
+
+# 캐시할 최대 이미지 수
+RENDER_CACHE_ENTRIES = 64
+
+
+def render_line_chart(data, y_columns, title, ylabel, fmt="png", dpi=DPI):
+    """x 가 인덱스인 프레임을 선 그래프 이미지 바이트로 변환."""
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    for col in y_columns:
+        ax.plot(data.index, data[col], label=col, marker="o", linestyle="-")
+    ax.set_title(title)
+    ax.set_xlabel(data.index.name)
+    ax.set_ylabel(ylabel)
+    ax.legend()
+    ax.grid(True)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches="tight")
+    fig.clear()
+    return buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=RENDER_CACHE_ENTRIES)
+def line_chart_image(fingerprint, x, y_columns, title, ylabel, fmt="png", _df=None):
+    """_df 의 x 별 추이 그래프 이미지 (bytes).
+
+    fingerprint 는 _df 내용을 대표하는 값(데이터셋 해시 등)으로, _df 는 캐시 키에 넣지 않는다.
+    """
+    data = chart_data(_df, x, list(y_columns))
+    return render_line_chart(data, y_columns, title, ylabel, fmt)
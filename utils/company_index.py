@@ -0,0 +1,76 @@
+"""기업별 행 범위 인덱스.
+
+(CompanyID, Year) 로 한 번 정렬해 두고 CompanyID → 연속 행 범위(시작, 끝)를
+기록한다. 기업 전환은 전체 불리언 스캔 대신 iloc 슬라이스 한 번으로 끝난다.
+정렬된 프레임은 절약형 타입(to_compact)이며 등급 컬럼이 미리 붙어 있다.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.esg_data import align_categories, dataset_version, load_derived, to_compact
+from utils.grading import add_grade_columns
+from utils.registry import resolve
+
+SORT_KEYS = ["CompanyID", "Year"]
+
+
+def row_ranges(company_ids):
+    """정렬된 CompanyID 배열에서 {CompanyID: (시작, 끝)} 계산 (정렬 없이 O(n))."""
+    ids, starts, counts = np.unique(company_ids, return_index=True, return_counts=True)
+    return {int(cid): (int(start), int(start + count)) for cid, start, count in zip(ids, starts, counts)}
+
+
+def _sort_key(df):
+    # (CompanyID, Year) 를 하나의 정수 키로 합침
+    return df["CompanyID"].to_numpy(dtype="int64") * 65536 + df["Year"].to_numpy(dtype="int64")
+
+
+def build_company_index(df):
+    """정렬된 프레임과 {CompanyID: (시작 행, 끝 행)} 을 반환."""
+    sorted_df = df.sort_values(SORT_KEYS, kind="stable").reset_index(drop=True)
+    return sorted_df, row_ranges(sorted_df["CompanyID"].to_numpy())
+
+
+def append_company_index(sorted_df, index, new_rows):
+    """새 행을 정렬 위치에 끼워 넣고 인덱스를 갱신 (전체 재정렬 없음)."""
+    new_rows = new_rows.sort_values(SORT_KEYS, kind="stable")
+    sorted_df, new_rows = align_categories(sorted_df, new_rows)
+    new_rows = new_rows.astype(sorted_df.dtypes[new_rows.columns])
+    positions = np.searchsorted(_sort_key(sorted_df), _sort_key(new_rows), side="right")
+    order = np.insert(np.arange(len(sorted_df)), positions, np.arange(len(new_rows)) + len(sorted_df))
+    merged = pd.concat([sorted_df, new_rows], ignore_index=True).take(order).reset_index(drop=True)
+    # 새 행이 들어간 기업은 범위가 늘고, 그 뒤 기업들은 시작 위치만 밀림
+    return merged, row_ranges(merged["CompanyID"].to_numpy())
+
+
+def company_slice(sorted_df, index, company_id):
+    """한 기업의 연도별 행 (O(1) 슬라이스)."""
+    start, stop = index[company_id]
+    return sorted_df.iloc[start:stop]
+
+
+def company_options(sorted_df, index):
+    """선택 위젯용 {CompanyID: CompanyName}."""
+    starts = [start for start, _ in index.values()]
+    names = sorted_df["CompanyName"].to_numpy()[starts]
+    return dict(zip(index, names))
+
+
+def build_graded_index(df):
+    """절약형 변환·등급 컬럼 추가 후 기업 인덱스 생성 (파생 산출물 'company_index')."""
+    return build_company_index(add_grade_columns(to_compact(df)))
+
+
+@st.cache_data(show_spinner=False)
+def _load_cached(version, _path):
+    return load_derived("company_index", build_graded_index, _path)
+
+
+def load_company_index(source="esg"):
+    """등급이 붙은 정렬 ESG 프레임과 기업 인덱스 반환. 파일이 없으면 FileNotFoundError.
+
+    source 는 데이터셋 논리 이름 또는 경로.
+    """
+    path = resolve(source)
+    return _load_cached(dataset_version(path), path)
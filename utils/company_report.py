@@ -0,0 +1,222 @@
+"""기업별 ESG 개선 보고서를 정적 HTML 로 일괄 생성.
+
+_08 대시보드의 개선 과제(과제·해결책·기대 효과 + 점수 그래프)를 기업마다 HTML 한 장
+(차트는 PNG 를 base64 로 내장)으로 만든다. 데이터는 부모 프로세스에서 한 번만 읽고,
+fork 로 띄운 작업 프로세스가 그 메모리를 그대로(copy-on-write) 나눠 쓴다. fork 가
+없는 플랫폼에서는 작업 프로세스마다 한 번씩 넘긴다.
+기업 행 내용 해시를 manifest.json 에 남겨, 입력 행이 그대로인 기업은 건너뛴다.
+
+사용법 (저장소 루트에서):
+    python -m utils.company_report                       # .cache/reports/ 에 전체 생성
+    python -m utils.company_report --workers 4 --out reports
+    python -m utils.company_report --companies 1 2 3 --force
+"""
+import argparse
+import base64
+import hashlib
+import html
+import json
+import multiprocessing
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from utils.chart_data import chart_data
+from utils.chart_render import render_line_chart
+from utils.company_index import build_graded_index, company_options, company_slice
+from utils.esg_data import CACHE_DIR, load_derived
+from utils.grading import grade_label
+from utils.improvement import rules_version, triggered_rules
+from utils.interpolate import fill_panel
+from utils.registry import resolve
+
+OUT_DIR = CACHE_DIR / "reports"
+
+# 보고서 모양이 바뀌면 올림 (모든 기업을 다시 생성)
+REPORT_FORMAT = 1
+
+# 보고서 차트 해상도 (대시보드보다 낮춰 파일 크기·생성 시간을 줄임)
+DPI = 100
+
+SCORE_COLUMNS = ["ESG_Environmental", "ESG_Social", "ESG_Governance", "ESG_Overall"]
+
+ENV_METRICS = [
+    ("🌍 탄소배출량", "CarbonEmissions", "tCO₂"),
+    ("💧 물 사용량", "WaterUsage", "tons"),
+    ("⚡ 에너지 소비량", "EnergyConsumption", "MWh"),
+]
+
+STYLE = """
+body { font-family: sans-serif; max-width: 960px; margin: 2em auto; color: #222; }
+table { border-collapse: collapse; margin: 1em 0; }
+td, th { border: 1px solid #ccc; padding: 4px 10px; text-align: right; }
+img { max-width: 100%; }
+"""
+
+# 작업 프로세스가 쓰는 정렬 프레임과 기업 인덱스 (fork 면 부모 것을 그대로 물려받음)
+_shared = {}
+
+
+def report_name(company_id):
+    return f"company_{company_id}.html"
+
+
+def fingerprints(sorted_df, index):
+    """{CompanyID: 그 기업 행 내용 해시}. 행 해시는 전체 프레임에서 한 번에 계산."""
+    row_hashes = pd.util.hash_pandas_object(sorted_df, index=False).to_numpy()
+    # 규칙 표가 바뀌어도 다시 생성
+    header = f"{REPORT_FORMAT}|{rules_version()}|".encode()
+    return {
+        cid: hashlib.blake2b(header + row_hashes[start:stop].tobytes(), digest_size=16).hexdigest()
+        for cid, (start, stop) in index.items()
+    }
+
+
+def _chart(trend, columns, title, ylabel):
+    # matplotlib 기본 글꼴에 한글이 없어 차트 제목·축은 영문 (06 페이지와 같음)
+    image = render_line_chart(chart_data(trend, "Year", columns), columns, title, ylabel, dpi=DPI)
+    return f'<img alt="{html.escape(title)}" src="data:image/png;base64,{base64.b64encode(image).decode()}">'
+
+
+def report_html(company_df):
+    """한 기업(연도순 행)의 개선 보고서 HTML."""
+    info = company_df.iloc[0]
+    latest = company_df.iloc[-1]
+    trend = fill_panel(company_df, "CompanyID", SCORE_COLUMNS)
+    esc = lambda value: html.escape(str(value))
+
+    grades = "".join(
+        f"<tr><th>{esc(col)}</th><td>{latest[col]:.1f}</td><td>{esc(grade_label(latest[col]))}</td></tr>"
+        for col in SCORE_COLUMNS
+    )
+    env = "".join(f"<tr><th>{label}</th><td>{latest[col]:,.1f} {unit}</td></tr>" for label, col, unit in ENV_METRICS)
+    parts = [
+        f"<!doctype html><html lang='ko'><head><meta charset='utf-8'>",
+        f"<title>{esc(info['CompanyName'])} ESG 개선 보고서</title><style>{STYLE}</style></head><body>",
+        f"<h1>📊 {esc(info['CompanyName'])} (#{int(info['CompanyID'])}) ESG 개선 보고서</h1>",
+        f"<p>산업군 <b>{esc(info['Industry'])}</b> · 지역 <b>{esc(info['Region'])}</b> · "
+        f"기준 연도 <b>{int(latest['Year'])}</b></p>",
+        f"<h2>📈 ESG 점수 및 등급</h2><table>{grades}</table>",
+        _chart(trend, SCORE_COLUMNS, "ESG Scores Over Time", "Score"),
+        f"<h2>🌿 환경 성과 지표</h2><table>{env}</table>",
+        "<h2>🛠️ 향후 ESG 개선 과제, 해결책 및 기대 효과</h2>",
+    ]
+    items = triggered_rules(latest)
+    for item in items:
+        solutions = "".join(f"<li>{esc(sol)}</li>" for sol in item["solutions"])
+        parts += [
+            f"<h3>🔍 {esc(item['area'])}</h3>",
+            f"<p><b>📌 문제 요약</b>: {esc(item['problem'])}</p>",
+            f"<p><b>🧩 해결 방안 제안:</b></p><ul>{solutions}</ul>",
+            f"<p><b>✨ 기대 효과</b>: {esc(item['effect'])}</p>",
+            _chart(trend, [item["metric"]], f"{item['metric']} Over Time", "Score"),
+            "<hr>",
+        ]
+    if not items:
+        parts.append("<p>모든 ESG 항목이 양호한 수준입니다. 🎉</p>")
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+def _init(sorted_df, index):
+    # fork 가 없을 때(spawn) 작업 프로세스마다 한 번 받음
+    _shared["df"], _shared["index"] = sorted_df, index
+
+
+def _render(job):
+    company_id, digest, out_dir = job
+    target = out_dir / report_name(company_id)
+    tmp = target.with_suffix(".html.tmp")
+    tmp.write_text(report_html(company_slice(_shared["df"], _shared["index"], company_id)), encoding="utf-8")
+    os.replace(tmp, target)
+    return company_id, digest
+
+
+def _read_manifest(path):
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest.get("companies", {}) if manifest.get("format") == REPORT_FORMAT else {}
+
+
+def _write_index(out_dir, names, done):
+    rows = "".join(
+        f"<li><a href='{report_name(cid)}'>{html.escape(str(names[cid]))} (#{cid})</a></li>"
+        for cid in names if str(cid) in done
+    )
+    (out_dir / "index.html").write_text(
+        f"<!doctype html><html lang='ko'><head><meta charset='utf-8'><title>ESG 개선 보고서</title>"
+        f"<style>{STYLE}</style></head><body><h1>📚 기업별 ESG 개선 보고서</h1><ul>{rows}</ul></body></html>",
+        encoding="utf-8",
+    )
+
+
+def generate_reports(source="esg", out_dir=OUT_DIR, workers=None, companies=None, force=False):
+    """보고서를 생성하고 {rendered, skipped, seconds, workers} 반환.
+
+    companies 를 주면 그 기업만, force 면 입력이 그대로여도 다시 만든다.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    sorted_df, index = load_derived("company_index", build_graded_index, resolve(source))
+    ids = list(index) if companies is None else list(companies)
+    unknown = [cid for cid in ids if cid not in index]
+    if unknown:
+        raise ValueError(f"없는 CompanyID: {unknown[:5]}")
+
+    digests = fingerprints(sorted_df, index)
+    manifest_path = out_dir / "manifest.json"
+    done = _read_manifest(manifest_path)
+    jobs = [
+        (cid, digests[cid], out_dir) for cid in ids
+        if force or done.get(str(cid)) != digests[cid] or not (out_dir / report_name(cid)).exists()
+    ]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+
+    _shared["df"], _shared["index"] = sorted_df, index
+    start = time.perf_counter()
+    try:
+        if workers == 1:
+            for cid, digest in map(_render, jobs):
+                done[str(cid)] = digest
+        else:
+            fork = "fork" in multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if fork else "spawn")
+            initializer, initargs = (None, ()) if fork else (_init, (sorted_df, index))
+            with context.Pool(workers, initializer, initargs) as pool:
+                chunksize = max(1, len(jobs) // (workers * 8))
+                for cid, digest in pool.imap_unordered(_render, jobs, chunksize):
+                    done[str(cid)] = digest
+    finally:
+        # 중간에 멈춰도 끝난 기업은 다음 실행에서 건너뜀
+        manifest_path.write_text(json.dumps({"format": REPORT_FORMAT, "companies": done}), encoding="utf-8")
+    seconds = time.perf_counter() - start
+
+    _write_index(out_dir, company_options(sorted_df, index), done)
+    return {"rendered": len(jobs), "skipped": len(ids) - len(jobs), "seconds": seconds, "workers": workers}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default="esg", help="데이터셋 이름 또는 CSV 경로 (기본: esg)")
+    parser.add_argument("--out", type=Path, default=OUT_DIR, help=f"출력 폴더 (기본: {OUT_DIR})")
+    parser.add_argument("--workers", type=int, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--companies", type=int, nargs="+", help="이 CompanyID 만 생성")
+    parser.add_argument("--force", action="store_true", help="입력이 그대로인 기업도 다시 생성")
+    args = parser.parse_args()
+
+    try:
+        summary = generate_reports(args.target, args.out, args.workers, args.companies, args.force)
+    except ValueError as exc:
+        parser.error(str(exc))
+    rate = summary["rendered"] / summary["seconds"] if summary["seconds"] else 0.0
+    print(f"✅ 보고서 {summary['rendered']:,}개 생성, {summary['skipped']:,}개 건너뜀 "
+          f"· {summary['seconds']:.1f}s · {rate:,.1f}개/s (프로세스 {summary['workers']}개)")
+    print(f"   {args.out / 'index.html'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""ESG 데이터 공용 로더.
+
+esg_data.csv 를 한 번만 파싱해 .cache/ 아래 Parquet 스냅샷으로 저장하고,
+원본 CSV 의 수정시각(mtime)이나 내용 해시가 바뀔 때만 스냅샷을 다시 만든다.
+스냅샷과 파생 산출물(기업 인덱스, 집계 큐브 등)은 내용 해시 이름으로 저장하고
+(.cache/<해시>.parquet, .cache/<해시>.<이름>.pkl), 원본 파일별 매니페스트
+(.cache/sources/)가 현재 해시를 가리킨다. 내용이 같은 파일은 산출물을 공유한다.
+"""
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from utils.registry import DATASETS, ROOT, resolve
+
+CSV_FILE = DATASETS["esg"]
+CACHE_DIR = ROOT / ".cache"
+SOURCES_DIR = CACHE_DIR / "sources"
+
+# esg_data.csv 컬럼 타입 (read_csv 추론 결과를 명시적으로 고정)
+DTYPES = {
+    "CompanyID": "int64",
+    "CompanyName": str,
+    "Industry": str,
+    "Region": str,
+    "Year": "int64",
+    "Revenue": "float64",
+    "ProfitMargin": "float64",
+    "MarketCap": "float64",
+    "GrowthRate": "float64",
+    "ESG_Overall": "float64",
+    "ESG_Environmental": "float64",
+    "ESG_Social": "float64",
+    "ESG_Governance": "float64",
+    "CarbonEmissions": "float64",
+    "WaterUsage": "float64",
+    "EnergyConsumption": "float64",
+}
+
+# 카디널리티가 낮은 문자열 컬럼 (절약 모드에서 범주형)
+CATEGORY_COLUMNS = ["CompanyName", "Industry", "Region"]
+
+# 수치 지표 컬럼 (절약 모드에서 선택적으로 float32)
+METRIC_COLUMNS = [col for col, dtype in DTYPES.items() if dtype == "float64"]
+
+# 파생 산출물 저장 형식이 바뀌면 올림 (예전 형식 캐시는 자동으로 다시 생성)
+DERIVED_FORMAT = 3
+
+# 스냅샷 Parquet 행 그룹 크기 (SQL 질의가 min/max 통계로 행 그룹을 건너뛸 수 있게 나눔)
+ROW_GROUP_SIZE = 64_000
+
+
+def file_fingerprint(path):
+    """파일 내용의 sha256 해시 (1MB 단위로 읽음)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_csv(path=CSV_FILE):
+    """CSV 원본을 고정된 컬럼 타입으로 파싱."""
+    return pd.read_csv(path, dtype=DTYPES)
+
+
+def to_compact(df, float32=False):
+    """메모리 절약형 타입으로 변환.
+
+    문자열 → 범주형, CompanyID → int32, Year → int16, float32=True 면 지표도 float32.
+    """
+    dtypes = {col: "category" for col in CATEGORY_COLUMNS}
+    dtypes.update(CompanyID="int32", Year="int16")
+    if float32:
+        dtypes.update({col: "float32" for col in METRIC_COLUMNS})
+    return df.astype(dtypes)
+
+
+def align_categories(base, new):
+    """new 의 범주형 컬럼을 base 의 범주(+새 값)에 맞춤. base 의 기존 코드는 그대로."""
+    for col in CATEGORY_COLUMNS:
+        if isinstance(base[col].dtype, pd.CategoricalDtype):
+            added = pd.Index(new[col].astype(str).unique()).difference(base[col].cat.categories)
+            if len(added):
+                base[col] = base[col].cat.add_categories(added)
+            new[col] = pd.Categorical(new[col].astype(str), categories=base[col].cat.categories)
+    return base, new
+
+
+def _manifest_path(path):
+    # 원본 파일별 매니페스트 (같은 이름의 다른 폴더 파일과 겹치지 않게 절대경로 해시를 붙임)
+    path = Path(path).resolve()
+    tag = hashlib.sha1(str(path).encode("utf-8")).hexdigest()[:8]
+    return SOURCES_DIR / f"{path.stem}-{tag}.json"
+
+
+def artifact_path(version, suffix):
+    """내용 해시(version)로 이름 붙인 캐시 산출물 경로. 예: artifact_path(v, ".parquet")."""
+    return CACHE_DIR / f"{version}{suffix}"
+
+
+def artifact_files(version):
+    """해당 해시의 캐시 산출물 목록."""
+    return sorted(CACHE_DIR.glob(f"{version}.*"))
+
+
+def _read_manifest(manifest_path):
+    try:
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(manifest_path, manifest):
+    tmp = manifest_path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(manifest), encoding="utf-8")
+    os.replace(tmp, manifest_path)
+
+
+def _watermark(df, batches=()):
+    """스냅샷에 반영된 범위 기록 (행 수, 최신 연도, 적재한 배치 해시)."""
+    return {
+        "rows": len(df),
+        "max_year": int(df["Year"].max()) if len(df) else None,
+        "batches": list(batches),
+    }
+
+
+def write_snapshot(df, path=CSV_FILE, digest=None, batches=()):
+    """프레임을 Parquet 스냅샷으로 쓰고 원본 CSV 기준 매니페스트를 반환.
+
+    같은 해시의 스냅샷이 이미 있으면(내용이 같은 다른 파일) 다시 쓰지 않는다.
+    """
+    stat = os.stat(path)
+    manifest = {
+        "path": str(Path(path).resolve()),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest or file_fingerprint(path),
+        "watermark": _watermark(df, batches),
+    }
+    snapshot_path = artifact_path(manifest["sha256"], ".parquet")
+    try:
+        SOURCES_DIR.mkdir(parents=True, exist_ok=True)
+        if not snapshot_path.exists():
+            tmp = snapshot_path.with_suffix(".parquet.tmp")
+            df.to_parquet(tmp, index=False, row_group_size=ROW_GROUP_SIZE)
+            os.replace(tmp, snapshot_path)
+        _write_manifest(_manifest_path(path), manifest)
+    except OSError:
+        # 읽기 전용 환경 등에서는 스냅샷 없이 파싱 결과만 사용
+        pass
+    return manifest
+
+
+def build_snapshot(path=CSV_FILE, digest=None):
+    """CSV 를 파싱해 Parquet 스냅샷과 매니페스트(mtime, 크기, 해시)를 기록.
+
+    내용이 같은 스냅샷이 이미 있으면 파싱하지 않고 매니페스트만 연결한다.
+    """
+    digest = digest or file_fingerprint(path)
+    previous = _read_manifest(_manifest_path(path)) or {}
+    batches = previous.get("watermark", {}).get("batches", [])
+    snapshot_path = artifact_path(digest, ".parquet")
+    if snapshot_path.exists():
+        df = pd.read_parquet(snapshot_path)
+        return write_snapshot(df, path, digest, batches), df
+    df = read_csv(path)
+    return write_snapshot(df, path, digest, batches), df
+
+
+def ensure_snapshot(path=CSV_FILE):
+    """스냅샷을 원본과 맞춘 뒤 (매니페스트, 새로 읽은 프레임 또는 None) 반환."""
+    stat = os.stat(path)
+    manifest = _read_manifest(_manifest_path(path))
+    if manifest is None or not artifact_path(manifest["sha256"], ".parquet").exists():
+        return build_snapshot(path)
+
+    # mtime 과 크기가 같으면 해시 계산 없이 바로 사용
+    if manifest["mtime_ns"] == stat.st_mtime_ns and manifest["size"] == stat.st_size:
+        return manifest, None
+
+    # mtime 만 바뀐 경우(touch, 재배포 등) 내용 해시로 한 번 더 확인
+    digest = file_fingerprint(path)
+    if manifest["sha256"] != digest:
+        return build_snapshot(path, digest)
+    manifest.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+    try:
+        _write_manifest(_manifest_path(path), manifest)
+    except OSError:
+        pass
+    return manifest, None
+
+
+def dataset_version(source="esg"):
+    """데이터셋(논리 이름 또는 경로)의 현재 내용 해시. 파일이 없으면 FileNotFoundError."""
+    manifest, _ = ensure_snapshot(resolve(source))
+    return manifest["sha256"]
+
+
+def read_snapshot(path=CSV_FILE):
+    """스냅샷이 원본과 일치하면 Parquet 에서, 아니면 CSV 에서 다시 읽기."""
+    manifest, df = ensure_snapshot(path)
+    if df is None:
+        df = pd.read_parquet(artifact_path(manifest["sha256"], ".parquet"))
+    return df
+
+
+def save_derived(name, value, version):
+    """파생 산출물을 내용 해시(version) 이름으로 .cache 에 저장."""
+    target = artifact_path(version, f".{name}.pkl")
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        tmp = target.with_suffix(".pkl.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump((DERIVED_FORMAT, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, target)
+    except OSError:
+        pass
+
+
+def load_derived(name, build, path=CSV_FILE):
+    """스냅샷에서 만든 파생 산출물(기업 인덱스, 집계 큐브 등) 반환.
+
+    현재 내용 해시로 저장된 산출물이 있으면 그대로 읽고,
+    없으면 build(df) 로 만들어 저장한다.
+    """
+    manifest, df = ensure_snapshot(path)
+    version = manifest["sha256"]
+    try:
+        with open(artifact_path(version, f".{name}.pkl"), "rb") as f:
+            fmt, value = pickle.load(f)
+        if fmt == DERIVED_FORMAT:
+            return value
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+    if df is None:
+        df = pd.read_parquet(artifact_path(version, ".parquet"))
+    value = build(df)
+    save_derived(name, value, version)
+    return value
+
+
+def prune_cache():
+    """어떤 원본 매니페스트도 가리키지 않는 해시의 산출물을 삭제하고 목록 반환."""
+    referenced = set()
+    for manifest_path in SOURCES_DIR.glob("*.json"):
+        manifest = _read_manifest(manifest_path)
+        if manifest and os.path.exists(manifest.get("path", "")):
+            referenced.add(manifest["sha256"])
+    removed = []
+    for artifact in CACHE_DIR.glob("*.*"):
+        version = artifact.name.split(".", 1)[0]
+        if len(version) == 64 and version not in referenced:
+            artifact.unlink(missing_ok=True)
+            removed.append(artifact)
+    return removed
+
+
+@st.cache_data(show_spinner=False)
+def _load_cached(version, compact, float32, _path):
+    # 캐시 키는 내용 해시 → 내용이 같은 파일은 한 항목을 공유
+    df = read_snapshot(_path)
+    return to_compact(df, float32) if compact else df
+
+
+def load_esg_data(source="esg", compact=False, float32=False):
+    """ESG 데이터프레임 반환 (source: 논리 이름 또는 경로). 파일이 없으면 FileNotFoundError.
+
+    compact=True 면 to_compact() 로 변환한 절약형 프레임 (float32 는 이때만 적용).
+    """
+    path = resolve(source)
+    return _load_cached(dataset_version(path), compact, float32, path)
@@ -0,0 +1,75 @@
+"""ESG 등급 계산 (벡터화).
+
+페이지마다 복사돼 있던 get_grade / classify_esg 를 대체한다.
+점수 컬럼 전체를 한 번에 경계값으로 구간화해 범주형(category) 등급을 만든다.
+"""
+import numpy as np
+import pandas as pd
+
+# 등급 체계: 경계값(높은 순)과 등급 라벨(높은 순)
+GRADE_SCHEMES = {
+    # ESG 대시보드(05~08) 기준
+    "esg": ((80, 60, 40), ("A (우수)", "B (보통)", "C (주의)", "D (위험)")),
+    # 지속가능 KPI 페이지(04) 기준
+    "kpi": ((85, 75, 65), ("A등급", "B등급", "C등급", "D등급")),
+}
+
+# 점수 컬럼 → 등급 컬럼
+GRADE_COLUMNS = {
+    "ESG_Environmental": "Environmental_Grade",
+    "ESG_Social": "Social_Grade",
+    "ESG_Governance": "Governance_Grade",
+    "ESG_Overall": "ESG_Grade",
+}
+
+
+def _resolve(scheme):
+    """등급 체계 이름 또는 (경계값, 라벨) 튜플을 받아 검증."""
+    if isinstance(scheme, str):
+        scheme = GRADE_SCHEMES[scheme]
+    thresholds, labels = scheme
+    if len(labels) != len(thresholds) + 1:
+        raise ValueError("등급 라벨 수는 경계값 수보다 1개 많아야 합니다.")
+    if list(thresholds) != sorted(thresholds, reverse=True):
+        raise ValueError("경계값은 높은 순으로 지정해야 합니다.")
+    return thresholds, tuple(labels)
+
+
+def grade_codes(scores, scheme="esg"):
+    """점수 배열(1차원/2차원)을 등급 코드로 변환. 0이 최고 등급, 결측은 -1."""
+    thresholds, _ = _resolve(scheme)
+    values = np.asarray(scores, dtype="float64")
+    # 넘은 경계값 개수를 세면 등급이 정해짐 (경계값이 몇 개뿐이라 searchsorted 보다 빠름)
+    codes = np.full(values.shape, len(thresholds), dtype="int8")
+    for threshold in thresholds:
+        codes -= values >= threshold
+    codes[np.isnan(values)] = -1
+    return codes
+
+
+def grade(scores, scheme="esg"):
+    """점수 시리즈/배열을 범주형 등급으로 변환 (get_grade 의 벡터화 버전)."""
+    _, labels = _resolve(scheme)
+    result = pd.Categorical.from_codes(grade_codes(scores, scheme), categories=labels)
+    if isinstance(scores, pd.Series):
+        return pd.Series(result, index=scores.index, name=scores.name)
+    return result
+
+
+def grade_label(score, scheme="esg"):
+    """단일 점수의 등급 라벨 (사이드바 요약 등 스칼라 용도).
+
+    결측 점수는 기존 get_grade 와 같이 최저 등급 라벨로 표시한다.
+    """
+    _, labels = _resolve(scheme)
+    code = grade_codes([score], scheme)[0]
+    return labels[code] if code >= 0 else labels[-1]
+
+
+def add_grade_columns(df, scheme="esg", columns=GRADE_COLUMNS):
+    """점수 컬럼 전체를 한 번에 등급화해 등급 컬럼을 추가하고 df 를 반환."""
+    _, labels = _resolve(scheme)
+    codes = grade_codes(df[list(columns)].to_numpy(dtype="float64"), scheme)
+    for j, grade_col in enumerate(columns.values()):
+        df[grade_col] = pd.Categorical.from_codes(codes[:, j], categories=labels)
+    return df
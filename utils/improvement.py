@@ -0,0 +1,146 @@
+"""ESG 개선 과제 규칙 엔진 (벡터화).
+
+05·06·_07·_08 페이지마다 `if latest[...] < 60` 으로 흩어져 있던 개선 과제 판단을
+규칙 표(RULES)로 옮겼다. 규칙은 (지표, 비교 연산, 기준값, 메시지, 해결책) 데이터이고,
+전체 기업 × 연도 행에 대해 규칙별 불리언 마스크를 한 번에 계산한다.
+결과(rule_hits)는 데이터 해시·규칙 해시별 파생 산출물로 저장해, 기업 화면의
+과제 목록과 전체 기업 집계를 같은 표에서 꺼낸다.
+"""
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.esg_data import dataset_version, load_derived
+from utils.registry import resolve
+
+OPS = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+}
+
+KEY = ["CompanyID", "Year"]
+
+# message: 요약 한 줄 (05·06·_07), problem/solutions/effect: 상세 보고서 (_08, 정적 보고서)
+RULES = [
+    {
+        "id": "E",
+        "area": "환경 (E)",
+        "metric": "ESG_Environmental",
+        "op": "<",
+        "threshold": 60,
+        "message": "✔ **환경(E)**: 탄소 감축, 친환경 설비 도입 필요",
+        "problem": "탄소 배출량 과다 및 에너지 효율 부족",
+        "solutions": [
+            "1️⃣ 친환경 설비 도입 (고효율 보일러, 폐열 회수 시스템 등)",
+            "2️⃣ 재생에너지 사용 확대 (태양광, 풍력 등)",
+            "3️⃣ 탄소배출권 거래제 적극 참여 및 저감 기술 적용"
+        ],
+        "effect": "🎯 에너지 비용 절감, 인센티브 확보, 글로벌 친환경 인증 획득",
+    },
+    {
+        "id": "S",
+        "area": "사회 (S)",
+        "metric": "ESG_Social",
+        "op": "<",
+        "threshold": 60,
+        "message": "✔ **사회(S)**: 직원 만족도 제고, 지역사회 활동 강화 필요",
+        "problem": "직원 만족도 및 사회적 책임 부족",
+        "solutions": [
+            "1️⃣ 유연근무제 및 복지제도 확대 (육아 지원 등)",
+            "2️⃣ 다양성과 포용성 프로그램 실행 (성별, 장애인 고용)",
+            "3️⃣ 지역사회 연계 프로젝트 및 기부 활동 강화"
+        ],
+        "effect": "🎯 직원 유지율 증가, 평판 개선, 이해관계자와의 관계 강화",
+    },
+    {
+        "id": "G",
+        "area": "지배구조 (G)",
+        "metric": "ESG_Governance",
+        "op": "<",
+        "threshold": 60,
+        "message": "✔ **지배구조(G)**: 투명경영, 이사회 다양성 확대 필요",
+        "problem": "이사회 다양성 부족 및 투명성 미흡",
+        "solutions": [
+            "1️⃣ 외부 감사 강화 및 윤리경영 준수 코드 도입",
+            "2️⃣ 이사회에 여성·전문가 비율 확대",
+            "3️⃣ 정기적인 리스크 평가와 내부 통제 시스템 운영"
+        ],
+        "effect": "🎯 기업 투명성 확보, 투자자 신뢰 증대, 리스크 관리 강화",
+    },
+]
+
+RULES_BY_ID = {rule["id"]: rule for rule in RULES}
+
+
+def rules_version(rules=RULES):
+    """규칙 표 내용 해시 (규칙이 바뀌면 저장된 평가 결과를 다시 만듦)."""
+    text = json.dumps(rules, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+
+
+def evaluate_rules(df, rules=RULES):
+    """행 × 규칙 불리언 마스크 (컬럼: 규칙 id, 인덱스: df 인덱스). 결측 값은 해당 없음."""
+    values = df[[rule["metric"] for rule in rules]].to_numpy(dtype="float64")
+    thresholds = np.array([rule["threshold"] for rule in rules], dtype="float64")
+    ops = np.array([rule["op"] for rule in rules])
+    mask = np.zeros(values.shape, dtype=bool)
+    # 같은 연산자를 쓰는 규칙끼리 한 번에 비교 (NaN 비교는 False)
+    for op in np.unique(ops):
+        cols = np.flatnonzero(ops == op)
+        mask[:, cols] = OPS[op](values[:, cols], thresholds[cols])
+    return pd.DataFrame(mask, index=df.index, columns=[rule["id"] for rule in rules])
+
+
+def triggered_rules(row, rules=RULES):
+    """한 행(최근 연도 등)에 해당하는 규칙 목록."""
+    hits = evaluate_rules(row.to_frame().T, rules).iloc[0]
+    return [rule for rule in rules if hits[rule["id"]]]
+
+
+def build_rule_hits(df):
+    """(CompanyID, Year) 인덱스 × 규칙 id 불리언 표 (파생 산출물 'rule_hits')."""
+    hits = evaluate_rules(df)
+    hits.index = pd.MultiIndex.from_frame(df[KEY].astype("int64"))
+    return hits.sort_index()
+
+
+@st.cache_data(show_spinner=False)
+def _load_cached(version, rules, _path):
+    return load_derived(f"rule_hits-{rules}", build_rule_hits, _path)
+
+
+def load_rule_hits(source="esg"):
+    """캐시된 규칙 평가 표 반환 (source: 데이터셋 이름 또는 경로). 파일이 없으면 FileNotFoundError."""
+    path = resolve(source)
+    return _load_cached(dataset_version(path), rules_version(), path)
+
+
+def rules_for(hits, company_id, year):
+    """평가 표에서 한 기업·연도에 해당하는 규칙 목록."""
+    row = hits.loc[(int(company_id), int(year))]
+    return [RULES_BY_ID[rule_id] for rule_id in hits.columns if row[rule_id]]
+
+
+def rule_counts(hits, year):
+    """해당 연도 규칙별 해당 기업 수와 전체 기업 수."""
+    year_hits = hits.xs(int(year), level="Year")
+    return year_hits.sum(), len(year_hits)
+
+
+def improvement_section(hits, company_id, year):
+    """'향후 ESG 개선 과제 제안' 본문: 해당 과제와 같은 연도 전체 기업 중 해당 비율."""
+    rules = rules_for(hits, company_id, year)
+    if not rules:
+        st.success("모든 ESG 항목이 양호한 수준입니다. 🎉")
+        return
+    counts, total = rule_counts(hits, year)
+    st.warning("현재 ESG 점수가 낮은 영역이 있습니다.")
+    for rule in rules:
+        st.markdown(rule["message"])
+        st.caption(f"{int(year)}년 전체 {total:,}개 기업 중 {counts[rule['id']]:,}곳"
+                   f"({counts[rule['id']] / total:.0%})이 같은 과제에 해당합니다.")
@@ -0,0 +1,180 @@
+"""신규 ESG 행 증분 적재.
+
+새 보고 연도/기업 행을 기존 스키마로 검증해 esg_data.csv 와 Parquet 스냅샷에
+덧붙이고, 파생 산출물(등급·기업 인덱스·집계 큐브·이상치 목록)은 새 행이 닿는 부분만 갱신한다.
+매니페스트 워터마크에 적재한 배치 해시를 남겨, 재시작 후 같은 배치를 다시
+넣어도 건너뛴다. CSV 에 덧붙인 뒤 워터마크를 남기기 전에 멈췄다면, 다시 넣을 때 배치의
+모든 행이 같은 값으로 이미 들어 있는 것을 확인하고 워터마크만 기록한 뒤 건너뛴다.
+
+사용법 (저장소 루트에서):
+    python -m utils.ingest new_rows.csv
+"""
+import argparse
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from utils.anomaly import build_anomalies, update_anomalies
+from utils.company_index import append_company_index, build_graded_index
+from utils.esg_data import (
+    DTYPES, ensure_snapshot, load_derived, prune_cache, read_snapshot, save_derived, write_snapshot,
+)
+from utils.grading import GRADE_COLUMNS, add_grade_columns
+from utils.peer_cube import build_peer_cube, update_peer_cube
+from utils.registry import resolve
+
+KEY = ["CompanyID", "Year"]
+
+# 빈 값을 허용하는 컬럼 (첫 연도 성장률 등)
+NULLABLE = {"GrowthRate"}
+
+# 기업마다 고정인 속성
+COMPANY_ATTRS = ["CompanyName", "Industry", "Region"]
+
+
+def batch_id(new_rows):
+    """배치 내용 해시 (스키마 컬럼 순서로 맞춘 CSV 텍스트 기준)."""
+    text = new_rows.reindex(columns=list(DTYPES)).to_csv(index=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def validate_rows(existing, new_rows):
+    """새 행을 기존 스키마로 검증하고 형 변환한 프레임 반환. 문제가 있으면 ValueError."""
+    missing = [col for col in DTYPES if col not in new_rows.columns]
+    extra = [col for col in new_rows.columns if col not in DTYPES]
+    if missing or extra:
+        raise ValueError(f"컬럼이 스키마와 다릅니다. 누락: {missing}, 추가: {extra}")
+
+    nulls = new_rows[[col for col in DTYPES if col not in NULLABLE]].isna().any()
+    if nulls.any():
+        raise ValueError(f"빈 값이 있는 필수 컬럼: {list(nulls[nulls].index)}")
+
+    try:
+        typed = new_rows[list(DTYPES)].astype(DTYPES).reset_index(drop=True)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"컬럼 타입 변환 실패: {exc}") from exc
+
+    scores = typed[list(GRADE_COLUMNS)]
+    if ((scores < 0) | (scores > 100)).any().any():
+        raise ValueError("ESG 점수는 0~100 사이여야 합니다.")
+
+    if typed.duplicated(KEY).any():
+        raise ValueError("배치 안에 중복된 (CompanyID, Year) 행이 있습니다.")
+    clash = typed[KEY].merge(existing[KEY], on=KEY)
+    if len(clash):
+        raise ValueError(f"이미 적재된 (CompanyID, Year) 행이 {len(clash)}건 있습니다: {clash.head(5).values.tolist()}")
+
+    # 기존 기업이면 기업명·산업군·지역이 그대로여야 함
+    known = existing.drop_duplicates("CompanyID").set_index("CompanyID")[COMPANY_ATTRS]
+    joined = typed[["CompanyID", *COMPANY_ATTRS]].join(known, on="CompanyID", how="inner", rsuffix="_known")
+    changed = pd.concat(
+        [joined[col].astype(str) != joined[f"{col}_known"].astype(str) for col in COMPANY_ATTRS], axis=1
+    ).any(axis=1)
+    if changed.any():
+        ids = sorted(int(cid) for cid in joined.loc[changed, "CompanyID"].unique())
+        raise ValueError(f"기존 기업 정보와 다른 행이 있습니다: CompanyID {ids[:5]}")
+    return typed
+
+
+def already_loaded(existing, new_rows):
+    """배치의 모든 (CompanyID, Year) 행이 같은 값으로 이미 들어 있는지."""
+    try:
+        typed = new_rows[list(DTYPES)].astype(DTYPES)
+    except (KeyError, TypeError, ValueError):
+        return False
+    if typed.empty or typed.duplicated(KEY).any():
+        return False
+    joined = typed.merge(existing[list(DTYPES)], on=KEY, how="inner", suffixes=("", "_loaded"))
+    if len(joined) != len(typed):
+        return False
+    for col in DTYPES:
+        if col in KEY:
+            continue
+        new, old = joined[col], joined[f"{col}_loaded"]
+        if pd.api.types.is_numeric_dtype(new.dtype):
+            new, old = new.to_numpy(dtype="float64"), old.to_numpy(dtype="float64")
+            same = (new == old) | (np.isnan(new) & np.isnan(old))
+        else:
+            same = (new.astype(str) == old.astype(str)).to_numpy()
+        if not same.all():
+            return False
+    return True
+
+
+def _append_csv(path, rows):
+    with open(path, "rb+") as f:
+        f.seek(0, 2)
+        if f.tell():
+            f.seek(-1, 2)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        rows.to_csv(f, header=False, index=False, lineterminator="\n")
+
+
+def ingest_rows(new_rows, source="esg"):
+    """새 행을 CSV·스냅샷·파생 산출물에 증분 반영하고 요약 dict 반환.
+
+    source 는 데이터셋 논리 이름 또는 경로. 단일 작성자(배치 작업 하나)를 전제로 한다.
+    """
+    path = resolve(source)
+    manifest, _ = ensure_snapshot(path)
+    watermark = manifest.get("watermark", {})
+    batch = batch_id(new_rows)
+    if batch in watermark.get("batches", []):
+        return {"batch": batch, "skipped": True, "rows": 0, "watermark": watermark}
+
+    # 파생 산출물은 적재 전 버전으로 읽어 둠 (없으면 지금 생성)
+    sorted_df, index = load_derived("company_index", build_graded_index, path)
+    cube = load_derived("peer_cube", build_peer_cube, path)
+    anomalies = load_derived("anomalies", build_anomalies, path)
+    existing = read_snapshot(path)
+    if already_loaded(existing, new_rows):
+        # CSV 에는 들어갔지만 워터마크 기록 전에 멈춘 배치: 워터마크만 채우고 건너뜀
+        manifest = write_snapshot(existing, path, manifest["sha256"], [*watermark.get("batches", []), batch])
+        return {"batch": batch, "skipped": True, "rows": 0, "watermark": manifest["watermark"]}
+    typed = validate_rows(existing, new_rows)
+
+    # 1) 원본 CSV 에 덧붙이고 스냅샷 갱신 (CSV 전체 재파싱 없음)
+    _append_csv(path, typed)
+    combined = pd.concat([existing, typed], ignore_index=True)
+    manifest = write_snapshot(combined, path, batches=[*watermark.get("batches", []), batch])
+
+    # 2) 등급은 새 행만 계산, 인덱스·큐브·이상치는 새 행이 닿는 기업/칸만 갱신
+    sorted_df, index = append_company_index(sorted_df, index, add_grade_columns(typed.copy()))
+    cube = update_peer_cube(cube, combined, typed)
+    anomalies = update_anomalies(anomalies, combined, typed)
+    save_derived("company_index", (sorted_df, index), manifest["sha256"])
+    save_derived("peer_cube", cube, manifest["sha256"])
+    save_derived("anomalies", anomalies, manifest["sha256"])
+
+    # 3) 이전 버전 산출물 정리 (내용이 같은 다른 파일이 쓰는 해시는 유지)
+    prune_cache()
+
+    return {
+        "batch": batch,
+        "skipped": False,
+        "rows": len(typed),
+        "companies": int(typed["CompanyID"].nunique()),
+        "years": sorted(int(year) for year in typed["Year"].unique()),
+        "watermark": manifest["watermark"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="새 ESG 행 CSV 를 esg_data.csv 에 증분 적재")
+    parser.add_argument("batch", help="추가할 행이 담긴 CSV (esg_data.csv 와 같은 컬럼)")
+    parser.add_argument("--target", default="esg", help="적재 대상 데이터셋 이름 또는 CSV 경로 (기본: esg)")
+    args = parser.parse_args()
+
+    summary = ingest_rows(pd.read_csv(args.batch), args.target)
+    if summary["skipped"]:
+        print(f"⏭ 이미 적재된 배치입니다 ({summary['batch'][:12]}).")
+    else:
+        print(f"✅ {summary['rows']}행 적재 (기업 {summary['companies']}곳, 연도 {summary['years']})")
+    print(f"   워터마크: {summary['watermark']['rows']}행, 최신 연도 {summary['watermark']['max_year']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""연도별 희소 시계열 보간.
+
+관측 연도만 있는 여러 계열을 (연도 × 계열) 배열 하나로 모아 한 번에 채운다.
+계열마다 관측 연도가 달라도 된다.
+
+- linear: 앞뒤 관측치 사이 직선 (누적 최대/최소로 앞뒤 관측 위치를 한꺼번에 찾음)
+- log_linear: 로그 값에서 직선 보간 (지수 성장 계열용, 양수만)
+- spline: 자연 3차 스플라인 (관측 연도 패턴이 같은 계열끼리 연립방정식 한 번에 풂)
+
+관측 범위 밖 연도는 NaN (hold_edges=True 면 가장 가까운 관측값).
+채운 결과는 계열 지문(연도·값·방법 해시)별로 LRU 에 보관해, 같은 계열은 다시 계산하지 않는다.
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from utils.lru import SizedLRU
+
+METHODS = ("linear", "log_linear", "spline")
+
+# 채운 계열 캐시 한도
+FILL_CACHE_BYTES = 64 * 1024 * 1024
+
+_filled = SizedLRU(FILL_CACHE_BYTES)
+
+
+def _neighbours(values):
+    # 칸마다 직전/직후 관측 위치 (없으면 -1 / 연도 수)
+    m = len(values)
+    valid = ~np.isnan(values)
+    rows = np.arange(m)[:, None]
+    prev = np.maximum.accumulate(np.where(valid, rows, -1), axis=0)
+    nxt = np.minimum.accumulate(np.where(valid, rows, m)[::-1], axis=0)[::-1]
+    return valid, prev, nxt
+
+
+def _linear(years, values, hold_edges):
+    m = len(years)
+    valid, prev, nxt = _neighbours(values)
+    p, n = np.clip(prev, 0, m - 1), np.clip(nxt, 0, m - 1)
+    y_prev = np.take_along_axis(values, p, axis=0)
+    y_next = np.take_along_axis(values, n, axis=0)
+    x_prev, x_next = years[p], years[n]
+    span = x_next - x_prev
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weight = np.where(span > 0, (years[:, None] - x_prev) / span, 0.0)
+    filled = y_prev + weight * (y_next - y_prev)
+    inside = (prev >= 0) & (nxt < m)
+    out = np.where(valid, values, np.where(inside, filled, np.nan))
+    if hold_edges:
+        out = np.where((prev < 0) & (nxt < m), y_next, out)
+        out = np.where((nxt >= m) & (prev >= 0), y_prev, out)
+    return out
+
+
+def _natural_spline(x, y, t):
+    """매듭 x(n), 값 y(n × k) 의 자연 3차 스플라인을 t(m) 에서 계산 → (m × k)."""
+    n = len(x)
+    h = np.diff(x)
+    # 양 끝 2차 미분 0, 안쪽 n-2 개는 삼중대각 연립방정식
+    a = np.zeros((n - 2, n - 2))
+    idx = np.arange(n - 2)
+    a[idx, idx] = 2 * (h[:-1] + h[1:])
+    a[idx[1:], idx[:-1]] = h[1:-1]
+    a[idx[:-1], idx[1:]] = h[1:-1]
+    slopes = np.diff(y, axis=0) / h[:, None]
+    second = np.zeros_like(y)
+    second[1:-1] = np.linalg.solve(a, 6 * np.diff(slopes, axis=0))
+
+    j = np.clip(np.searchsorted(x, t, side="right") - 1, 0, n - 2)
+    hj = h[j][:, None]
+    left, right = (x[j + 1] - t)[:, None], (t - x[j])[:, None]
+    return (
+        second[j] * left ** 3 / (6 * hj) + second[j + 1] * right ** 3 / (6 * hj)
+        + (y[j] / hj - second[j] * hj / 6) * left
+        + (y[j + 1] / hj - second[j + 1] * hj / 6) * right
+    )
+
+
+def _spline(years, values, hold_edges):
+    out = _linear(years, values, hold_edges)
+    valid = ~np.isnan(values)
+    # 관측 연도 패턴이 같은 계열끼리 묶어 한 번에 풂 (관측 3개 미만은 직선 보간 그대로)
+    patterns, groups = np.unique(valid.T, axis=0, return_inverse=True)
+    for g, pattern in enumerate(patterns):
+        knots = np.flatnonzero(pattern)
+        if len(knots) < 3:
+            continue
+        cols = np.flatnonzero(groups.ravel() == g)
+        rows = np.arange(knots[0], knots[-1] + 1)
+        out[np.ix_(rows, cols)] = _natural_spline(
+            years[knots], values[np.ix_(knots, cols)], years[rows]
+        )
+    return out
+
+
+def _fill(years, values, method, hold_edges):
+    if method == "linear":
+        return _linear(years, values, hold_edges)
+    if method == "log_linear":
+        if (values[~np.isnan(values)] <= 0).any():
+            raise ValueError("log_linear 보간은 양수 값만 가능합니다.")
+        return np.exp(_linear(years, np.log(values), hold_edges))
+    if method == "spline":
+        return _spline(years, values, hold_edges)
+    raise ValueError(f"알 수 없는 보간 방법: {method} (가능: {', '.join(METHODS)})")
+
+
+def fill_gaps(frame, method="linear", hold_edges=False):
+    """연도 인덱스 × 계열 컬럼 프레임의 빈칸(NaN)을 한 번에 채운 새 프레임.
+
+    이미 같은 계열(연도·값·방법이 같음)을 채운 적이 있으면 캐시에서 가져오고,
+    나머지 계열만 모아 한 번에 계산한다.
+    """
+    years = frame.index.to_numpy(dtype="float64")
+    values = frame.to_numpy(dtype="float64")
+    header = f"{method}|{hold_edges}|".encode() + years.tobytes()
+    keys = [hashlib.blake2b(header + values[:, j].tobytes(), digest_size=16).digest() for j in range(values.shape[1])]
+
+    out = np.empty_like(values)
+    missing = []
+    for j, key in enumerate(keys):
+        cached = _filled.get(key)
+        if cached is None:
+            missing.append(j)
+        else:
+            out[:, j] = cached
+    if missing:
+        filled = _fill(years, np.ascontiguousarray(values[:, missing]), method, hold_edges)
+        out[:, missing] = filled
+        for i, j in enumerate(missing):
+            column = filled[:, i].copy()
+            _filled.put(keys[j], column, column.nbytes)
+    return pd.DataFrame(out, index=frame.index, columns=frame.columns)
+
+
+def fill_years(series, first, last, method="linear", hold_edges=False):
+    """{이름: {연도: 값}} 관측치를 first–last 전체 연도로 채운 프레임 (인덱스 year)."""
+    index = pd.RangeIndex(first, last + 1, name="year")
+    frame = pd.DataFrame({name: pd.Series(observed, dtype="float64") for name, observed in series.items()})
+    return fill_gaps(frame.reindex(index), method, hold_edges)
+
+
+def fill_panel(df, entity, columns, year="Year", method="linear"):
+    """(entity, year) 긴 형식 패널의 빠진 연도를 엔티티 전체에 대해 한 번에 보간.
+
+    각 엔티티의 첫~마지막 관측 연도 사이 행을 모두 만든 프레임 반환
+    (entity, year, columns..., interpolated). interpolated 는 원래 없던 행이거나
+    행은 있어도 columns 중 결측값을 채운 칸이 있는 행 표시.
+    """
+    codes, entities = pd.factorize(df[entity], sort=True)
+    year_values = df[year].to_numpy(dtype="int64")
+    first = int(year_values.min()) if len(df) else 0
+    grid = np.arange(first, int(year_values.max()) + 1 if len(df) else 0)
+    rows = year_values - first
+
+    present = np.zeros((len(grid), len(entities)), dtype=bool)
+    present[rows, codes] = True
+    filled = {}
+    # 값을 새로 채운 칸 (없던 행 + 있던 행의 결측값)
+    patched = ~present
+    for col in columns:
+        wide = np.full((len(grid), len(entities)), np.nan)
+        wide[rows, codes] = df[col].to_numpy(dtype="float64")
+        filled[col] = fill_gaps(pd.DataFrame(wide, index=grid), method).to_numpy()
+        patched |= np.isnan(wide) & ~np.isnan(filled[col])
+
+    # 엔티티별 관측 범위 안의 칸만 남김
+    _, prev, nxt = _neighbours(np.where(present, 0.0, np.nan))
+    keep = (prev >= 0) & (nxt < len(grid))
+    year_idx, entity_idx = np.nonzero(keep)
+    out = pd.DataFrame({
+        entity: entities[entity_idx],
+        year: grid[year_idx].astype(df[year].dtype),
+    })
+    for col in columns:
+        out[col] = filled[col][year_idx, entity_idx]
+    out["interpolated"] = patched[year_idx, entity_idx]
+    return out.sort_values([entity, year], kind="stable", ignore_index=True)
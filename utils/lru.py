@@ -0,0 +1,56 @@
+"""크기 제한 LRU 캐시.
+
+세션·스레드가 함께 쓰는 캐시용. 항목 수와 총 바이트 수 두 가지 한도를
+넘으면 가장 오래 쓰지 않은 항목부터 내보낸다.
+"""
+import threading
+from collections import OrderedDict
+
+
+class SizedLRU:
+    def __init__(self, max_bytes, max_entries=None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """값 반환 (최근 사용으로 표시). 없으면 default."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def put(self, key, value, nbytes):
+        """값 저장 후 한도를 넘는 오래된 항목 제거. 한도보다 큰 값은 저장하지 않음."""
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes or (self.max_entries and len(self._entries) > self.max_entries):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+
+    def pop(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+            value, nbytes = self._entries.pop(key)
+            self.nbytes -= nbytes
+            return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
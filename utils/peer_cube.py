@@ -0,0 +1,86 @@
+"""동종업계 비교용 집계 큐브.
+
+산업군(Industry) × 지역(Region) × 연도(Year) 별로 ESG 점수와 환경 지표의
+평균·중앙값·p10·p90·기업 수를 미리 집계해 둔다. 산업군만/지역만/전체 묶음도
+함께 만들어(롤업) 비교 화면에서는 groupby 없이 조회만 한다.
+"""
+import pandas as pd
+import streamlit as st
+
+from utils.esg_data import dataset_version, load_derived
+from utils.registry import resolve
+
+# 롤업된 차원에 들어가는 값
+ALL = "전체"
+
+DIMENSIONS = ["Industry", "Region", "Year"]
+
+# 집계 묶음: 산업군×지역, 산업군, 지역, 전체 (모두 연도별)
+GROUPING_SETS = [
+    ("Industry", "Region", "Year"),
+    ("Industry", "Year"),
+    ("Region", "Year"),
+    ("Year",),
+]
+
+CUBE_METRICS = [
+    "ESG_Environmental", "ESG_Social", "ESG_Governance", "ESG_Overall",
+    "CarbonEmissions", "WaterUsage", "EnergyConsumption",
+]
+
+STATS = ["mean", "median", "p10", "p90", "count"]
+
+
+def _aggregate(df, keys):
+    grouped = df.groupby(list(keys), observed=True, sort=False)[CUBE_METRICS]
+    stats = pd.concat({
+        "mean": grouped.mean(),
+        "median": grouped.median(),
+        "p10": grouped.quantile(0.1),
+        "p90": grouped.quantile(0.9),
+        "count": grouped.count(),
+    }, axis=1)
+    # 롤업된 차원은 ALL 로 채워 세 차원 인덱스로 통일
+    index = stats.index.to_frame(index=False)
+    for dim in DIMENSIONS:
+        if dim not in keys:
+            index[dim] = ALL
+    stats.index = pd.MultiIndex.from_frame(index[DIMENSIONS])
+    return stats
+
+
+def _cube(parts):
+    cube = pd.concat(parts).swaplevel(axis=1)
+    return cube.reindex(columns=pd.MultiIndex.from_product([CUBE_METRICS, STATS]))
+
+
+def build_peer_cube(df):
+    """(Industry, Region, Year) 인덱스 × (지표, 통계) 컬럼의 집계 큐브."""
+    return _cube([_aggregate(df, keys) for keys in GROUPING_SETS]).sort_index()
+
+
+def update_peer_cube(cube, df, new_rows):
+    """new_rows 가 속한 칸만 df(추가 후 전체)에서 다시 집계해 큐브에 반영."""
+    parts = []
+    for keys in GROUPING_SETS:
+        cells = new_rows[list(keys)].drop_duplicates()
+        parts.append(_aggregate(df.merge(cells, on=list(keys)), keys))
+    fresh = _cube(parts)
+    return pd.concat([cube.drop(fresh.index, errors="ignore"), fresh]).sort_index()
+
+
+def peer_stats(cube, industry=ALL, region=ALL, year=None):
+    """큐브 한 칸 조회 → 지표(행) × 통계(열) 프레임. 없는 조합이면 KeyError."""
+    row = cube.loc[(industry, region, year)]
+    return row.unstack()[STATS].reindex(CUBE_METRICS)
+
+
+@st.cache_data(show_spinner=False)
+def _load_cached(version, _path):
+    return load_derived("peer_cube", build_peer_cube, _path)
+
+
+def load_peer_cube(source="esg"):
+    """캐시된 집계 큐브 반환 (source: 데이터셋 이름 또는 경로). 파일이 없으면 FileNotFoundError."""
+    path = resolve(source)
+    return _load_cached(dataset_version(path), path)
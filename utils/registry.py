@@ -0,0 +1,54 @@
+"""데이터셋 레지스트리.
+
+페이지는 파일 경로 대신 논리 이름("esg" 등)으로 데이터셋을 요청한다.
+스냅샷과 파생 캐시는 파일 내용 해시로 저장되므로(utils.esg_data), 내용이 같은
+파일들은 파싱 결과와 캐시를 하나만 공유하고, 파일이 바뀌면 그 파일에 달린
+캐시만 새로 만들어진다.
+
+사용법 (저장소 루트에서):
+    python -m utils.registry            # 데이터셋별 해시·캐시 상태
+    python -m utils.registry --prune    # 어떤 파일도 가리키지 않는 캐시 삭제
+"""
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 논리 이름 → 파일
+DATASETS = {
+    "esg": ROOT / "esg_data.csv",
+    # 저장소에 함께 올라온 사본 (esg_data.csv 와 내용이 같으면 캐시를 공유)
+    "esg_copy": ROOT / "2cb6a9c6-f5dc-493f-b0a5-8ed161e99a3a.csv",
+}
+
+
+def resolve(source):
+    """논리 이름이면 등록된 파일 경로, 아니면 경로로 간주해 Path 반환."""
+    if isinstance(source, str) and source in DATASETS:
+        return DATASETS[source]
+    return Path(source)
+
+
+def main():
+    # esg_data 가 이 모듈을 import 하므로 CLI 에서만 늦게 가져옴
+    from utils.esg_data import artifact_files, dataset_version, prune_cache
+
+    parser = argparse.ArgumentParser(description="데이터셋 레지스트리 상태 / 캐시 정리")
+    parser.add_argument("--prune", action="store_true", help="참조되지 않는 캐시 산출물 삭제")
+    args = parser.parse_args()
+
+    for name, path in DATASETS.items():
+        try:
+            version = dataset_version(name)
+        except FileNotFoundError:
+            print(f"{name:<10} {path.name}  (파일 없음)")
+            continue
+        artifacts = ", ".join(p.name[len(version) + 1:] for p in artifact_files(version))
+        print(f"{name:<10} {path.name}  {version[:12]}  [{artifacts}]")
+    if args.prune:
+        removed = prune_cache()
+        print(f"🧹 삭제한 캐시 파일: {len(removed)}개")
+
+
+if __name__ == "__main__":
+    main()
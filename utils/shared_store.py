@@ -0,0 +1,86 @@
+"""세션·프로세스 공용 ESG 데이터 (메모리 맵 Arrow).
+
+등급이 붙은 정렬 프레임(기업 인덱스 산출물)을 내용 해시별 Arrow IPC 파일로
+한 번 써 두고, 각 프로세스는 그 파일을 메모리 맵으로 연다. 페이지는 모두 같은
+읽기 전용 프레임을 받으며, 숫자 컬럼은 맵된 버퍼를 복사 없이 그대로 가리킨다.
+세션 수가 늘어도 프로세스 고유 메모리(RssAnon)는 늘지 않는다.
+"""
+import os
+import sys
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import streamlit as st
+
+from utils.company_index import build_graded_index, row_ranges
+from utils.esg_data import CACHE_DIR, CSV_FILE, artifact_path, dataset_version, ensure_snapshot, load_derived
+from utils.registry import resolve
+
+
+def write_shared(df, target):
+    """프레임을 압축 없는 Arrow IPC 파일로 기록 (메모리 맵용)."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    tmp = target.with_suffix(".arrow.tmp")
+    with pa.OSFile(str(tmp), "wb") as sink:
+        with ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp, target)
+
+
+def open_shared(path=CSV_FILE):
+    """(읽기 전용 프레임, 기업 인덱스, Arrow 테이블) 반환. 파일이 없으면 만든 뒤 연다."""
+    manifest, _ = ensure_snapshot(path)
+    target = artifact_path(manifest["sha256"], ".arrow")
+    if not target.exists():
+        sorted_df, _ = load_derived("company_index", build_graded_index, path)
+        CACHE_DIR.mkdir(exist_ok=True)
+        write_shared(sorted_df, target)
+    table = ipc.open_file(pa.memory_map(str(target))).read_all()
+    # split_blocks: 컬럼마다 따로 변환해 null 없는 숫자 컬럼은 맵 버퍼를 그대로 사용
+    frame = table.to_pandas(split_blocks=True)
+    index = row_ranges(frame["CompanyID"].to_numpy())
+    return frame, index, table
+
+
+@st.cache_resource(show_spinner=False)
+def _open_cached(version, _path):
+    # 캐시 키는 내용 해시 → 내용이 같은 파일은 한 번만 맵
+    return open_shared(_path)
+
+
+def load_shared_esg(source="esg"):
+    """모든 세션이 공유하는 (등급 포함 정렬 프레임, 기업 인덱스). 수정 불가.
+
+    source 는 데이터셋 논리 이름 또는 경로. 파일이 없으면 FileNotFoundError.
+    """
+    path = resolve(source)
+    frame, index, _ = _open_cached(dataset_version(path), path)
+    return frame, index
+
+
+def process_memory():
+    """현재 프로세스 메모리 (바이트): rss, rss_anon(프로세스 고유), rss_file(파일 맵), arrow_heap.
+
+    /proc 가 없는 환경에서는 현재 값 대신 max_rss(지금까지의 최대 RSS)만 채운다.
+    """
+    usage = {
+        "rss": None, "rss_anon": None, "rss_file": None, "max_rss": None,
+        "arrow_heap": pa.total_allocated_bytes(),
+    }
+    fields = {"VmRSS:": "rss", "RssAnon:": "rss_anon", "RssFile:": "rss_file"}
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                name, *rest = line.split()
+                if name in fields:
+                    usage[fields[name]] = int(rest[0]) * 1024
+    except OSError:
+        # /proc 가 없는 환경(macOS 등)은 최대 RSS 만 (Windows 는 resource 모듈이 없어 None)
+        try:
+            import resource
+        except ImportError:
+            return usage
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss 단위: Linux 는 KB, macOS 는 바이트
+        usage["max_rss"] = max_rss * 1024 if sys.platform.startswith("linux") else max_rss
+    return usage
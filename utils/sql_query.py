@@ -0,0 +1,124 @@
+"""ESG 데이터 SQL 질의 (DuckDB, 선택 의존성).
+
+Parquet 스냅샷을 DuckDB 뷰 esg 로 열어 프로세스 안에서 바로 질의한다. DuckDB 가
+WHERE 조건과 필요한 컬럼만 Parquet 스캔으로 내려보내므로(predicate/projection
+pushdown) 전체 프레임을 판다스로 올리지 않는다. 질의마다 새 메모리 DB 를 열고
+스냅샷 파일 외의 파일 접근·설정 변경은 막는다. 결과는 (데이터 해시, SQL, 행 한도)
+별로 크기 제한 LRU 에 보관한다.
+"""
+import threading
+import time
+
+import streamlit as st
+
+from utils.esg_data import artifact_path, dataset_version
+from utils.lru import SizedLRU
+from utils.registry import resolve
+
+try:
+    import duckdb
+except ImportError:  # requirements.txt 의 선택 의존성, 없으면 페이지에서 안내
+    duckdb = None
+
+TABLE = "esg"
+
+# 결과 행 한도와 질의 시간 한도(초)
+MAX_ROWS = 10_000
+TIMEOUT_SECONDS = 10
+
+# 질의 하나가 쓰는 스레드·메모리 한도
+THREADS = 2
+MEMORY_LIMIT = "1GB"
+
+# 결과 캐시 한도
+RESULT_CACHE_BYTES = 128 * 1024 * 1024
+RESULT_CACHE_ENTRIES = 64
+
+
+@st.cache_resource(show_spinner=False)
+def _result_cache():
+    # 프로세스 공용 결과 캐시 (세션 간 공유)
+    return SizedLRU(RESULT_CACHE_BYTES, RESULT_CACHE_ENTRIES)
+
+
+def check_query(sql):
+    """SELECT 문(WITH 포함) 하나인지 확인하고 끝 세미콜론을 뗀 SQL 반환. 아니면 ValueError."""
+    sql = sql.strip().rstrip(";").strip()
+    if not sql:
+        raise ValueError("SQL 을 입력하세요.")
+    try:
+        statements = duckdb.extract_statements(sql)
+    except duckdb.Error as exc:
+        raise ValueError(str(exc)) from exc
+    if len(statements) != 1:
+        raise ValueError("한 번에 SELECT 문 하나만 실행할 수 있습니다.")
+    if statements[0].type != duckdb.StatementType.SELECT:
+        raise ValueError("읽기 전용 SELECT 문만 실행할 수 있습니다.")
+    return sql
+
+
+def _connect(parquet_path):
+    con = duckdb.connect(config={"threads": THREADS, "memory_limit": MEMORY_LIMIT})
+    con.execute("SET allowed_paths = $1", [[str(parquet_path)]])
+    con.execute("SET enable_external_access = false")
+    con.execute("SET lock_configuration = true")
+    quoted = str(parquet_path).replace("'", "''")
+    con.execute(f"CREATE VIEW {TABLE} AS SELECT * FROM read_parquet('{quoted}')")
+    return con
+
+
+def _execute(con, sql, timeout):
+    # 시간 한도를 넘기면 다른 스레드에서 interrupt
+    timer = threading.Timer(timeout, con.interrupt)
+    timer.start()
+    try:
+        return con.execute(sql).df()
+    except duckdb.InterruptException as exc:
+        raise TimeoutError(f"{timeout}초 안에 끝나지 않아 중단했습니다.") from exc
+    except duckdb.Error as exc:
+        raise ValueError(str(exc)) from exc
+    finally:
+        timer.cancel()
+
+
+def run_query(sql, source="esg", max_rows=MAX_ROWS, timeout=TIMEOUT_SECONDS):
+    """SQL 을 실행해 {frame, truncated, seconds, version, cached} 반환.
+
+    SELECT 가 아니거나 SQL 오류면 ValueError, 시간 한도를 넘기면 TimeoutError,
+    데이터 파일이 없으면 FileNotFoundError.
+    """
+    sql = check_query(sql)
+    version = dataset_version(resolve(source))
+    key = (version, sql, max_rows)
+    cache = _result_cache()
+    hit = cache.get(key)
+    if hit is not None:
+        return {**hit, "cached": True}
+
+    con = _connect(artifact_path(version, ".parquet"))
+    try:
+        start = time.perf_counter()
+        # 한도 + 1 행까지 읽어 잘렸는지 판단 (줄바꿈: 끝의 -- 주석이 괄호를 삼키지 않게)
+        frame = _execute(con, f"SELECT * FROM (\n{sql}\n) AS q LIMIT {max_rows + 1}", timeout)
+        seconds = time.perf_counter() - start
+    finally:
+        con.close()
+    result = {
+        "frame": frame.iloc[:max_rows],
+        "truncated": len(frame) > max_rows,
+        "seconds": seconds,
+        "version": version,
+    }
+    cache.put(key, result, int(result["frame"].memory_usage(deep=True).sum()))
+    return {**result, "cached": False}
+
+
+def explain_query(sql, source="esg"):
+    """실행 계획 텍스트 (Parquet 스캔에 내려간 Filters/Projections 확인용)."""
+    sql = check_query(sql)
+    con = _connect(artifact_path(dataset_version(resolve(source)), ".parquet"))
+    try:
+        rows = _execute(con, f"EXPLAIN {sql}", TIMEOUT_SECONDS)
+    finally:
+        con.close()
+    return "\n".join(rows["explain_value"])
@@ -0,0 +1,126 @@
+"""서버 측 페이지 테이블.
+
+검색·컬럼 필터·정렬을 서버에서 프레임에 바로 적용하고 현재 페이지 행만
+st.dataframe 으로 보낸다. 렌더 비용은 전체 행 수가 아니라 페이지 크기에 비례한다.
+"""
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+PAGE_SIZE = 20
+
+# 문자열 컬럼 필터에서 보여 줄 최대 선택지 수
+MAX_FILTER_OPTIONS = 500
+
+_NO_SORT = "(원본 순서)"
+_NO_FILTER = "(없음)"
+
+
+def _is_text(series):
+    return isinstance(series.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(series.dtype)
+
+
+def _search_mask(df, query, columns):
+    """텍스트 컬럼 중 하나라도 query 를 포함하는 행 (대소문자 무시)."""
+    mask = np.zeros(len(df), dtype=bool)
+    for col in columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # 범주형은 범주(고유값)만 검사하고 코드로 행을 찾음
+            categories = series.cat.categories.astype(str)
+            hits = np.flatnonzero(categories.str.contains(query, case=False, regex=False))
+            mask |= np.isin(series.cat.codes.to_numpy(), hits)
+        elif pd.api.types.is_string_dtype(series.dtype):
+            mask |= series.astype(str).str.contains(query, case=False, regex=False).to_numpy(dtype=bool)
+    return mask
+
+
+def _filter_mask(series, condition):
+    if pd.api.types.is_numeric_dtype(series.dtype) and not isinstance(series.dtype, pd.CategoricalDtype):
+        lo, hi = condition
+        return series.between(lo, hi).to_numpy(dtype=bool)
+    return series.astype(str).isin(condition).to_numpy(dtype=bool)
+
+
+def _filter_widget(df, column, key):
+    """필터 컬럼 타입에 맞는 위젯을 그리고 조건(해시 가능) 반환. 조건이 없으면 None."""
+    if column == _NO_FILTER:
+        return None
+    series = df[column]
+    if _is_text(series):
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            options = list(series.cat.categories.astype(str))
+        else:
+            options = sorted(series.dropna().astype(str).unique()[:MAX_FILTER_OPTIONS])
+        chosen = st.multiselect("값 선택", options, key=f"{key}_fvalues")
+        return tuple(chosen) or None
+    if pd.api.types.is_numeric_dtype(series.dtype) and series.notna().any():
+        lo, hi = series.min(), series.max()
+        if lo == hi:
+            return None
+        if pd.api.types.is_integer_dtype(series.dtype):
+            lo, hi = int(lo), int(hi)
+        else:
+            lo, hi = float(lo), float(hi)
+        chosen = st.slider("범위", lo, hi, (lo, hi), key=f"{key}_frange")
+        return None if chosen == (lo, hi) else tuple(chosen)
+    return None
+
+
+def table_positions(df, query="", sort_col=None, descending=False, filter_col=None, condition=None, columns=None):
+    """검색·필터·정렬을 적용한 결과의 행 위치(정수 배열)."""
+    columns = list(df.columns) if columns is None else columns
+    mask = np.ones(len(df), dtype=bool)
+    if query:
+        mask &= _search_mask(df, query, columns)
+    if filter_col in df.columns and condition:
+        mask &= _filter_mask(df[filter_col], condition)
+    positions = np.flatnonzero(mask)
+    if sort_col in df.columns:
+        values = df[sort_col].take(positions).reset_index(drop=True)
+        order = values.sort_values(ascending=not descending, kind="stable", na_position="last").index
+        positions = positions[order.to_numpy()]
+    return positions
+
+
+def paged_table(df, key, columns=None, page_size=PAGE_SIZE, version=None):
+    """검색·필터·정렬·페이지 컨트롤이 달린 테이블. columns 로 보여 줄 컬럼을 고름.
+
+    version 을 주면 (version, 검색어, 필터, 정렬) 이 같은 동안 계산한 행 순서를
+    세션에 보관해, 페이지만 넘길 때는 슬라이스만 한다. df 내용이 바뀌면 version 도 바꿀 것.
+    """
+    columns = list(df.columns) if columns is None else list(columns)
+    search_col, sort_col_slot, order_slot = st.columns([3, 2, 1])
+    query = search_col.text_input("🔎 검색", key=f"{key}_query", placeholder="텍스트 컬럼에서 검색")
+    sort_col = sort_col_slot.selectbox("↕️ 정렬 기준", [_NO_SORT, *columns], key=f"{key}_sort")
+    descending = order_slot.toggle("내림차순", key=f"{key}_desc")
+    with st.expander("🧰 컬럼 필터"):
+        filter_col = st.selectbox("컬럼", [_NO_FILTER, *columns], key=f"{key}_fcol")
+        condition = _filter_widget(df, filter_col, key)
+
+    signature = (version, query, sort_col, descending, filter_col, condition)
+    previous, cached = st.session_state.get(f"{key}_positions", (None, None))
+    if version is not None and previous == signature:
+        positions = cached
+    else:
+        positions = table_positions(df, query, sort_col, descending, filter_col, condition, columns)
+        # 검색·필터·정렬이 바뀌면 첫 페이지부터
+        if previous is not None and previous[1:] != signature[1:]:
+            st.session_state[f"{key}_page"] = 1
+        st.session_state[f"{key}_positions"] = (signature, positions if version is not None else None)
+
+    table_slot = st.container()
+    total = len(positions)
+    pages = max(1, math.ceil(total / page_size))
+    # 필터로 페이지 수가 줄면 현재 페이지를 범위 안으로
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages
+    page = st.number_input("페이지", min_value=1, max_value=pages, step=1, key=f"{key}_page")
+
+    start = (page - 1) * page_size
+    stop = min(start + page_size, total)
+    with table_slot:
+        st.dataframe(df.take(positions[start:stop])[columns])
+        st.caption(f"총 {total:,}행 중 {start + 1 if total else 0:,}–{stop:,}행 · {page}/{pages} 페이지")
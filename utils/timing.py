@@ -0,0 +1,170 @@
+"""페이지 구간별 실행 시간 계측.
+
+    timer = page_timer("_08")
+    with timer("데이터 로드"):
+        df, index = load_shared_esg("esg")
+
+    @timer.wrap("차트")
+    def draw(...): ...
+
+    @timer.fragment("연도 범위")   # st.fragment 대신
+    def company_view(...): ...
+
+    timer.report()  # 페이지 끝: 사이드바 패널 + JSONL 로그 한 줄
+
+rerun 한 번 동안 같은 이름의 구간은 합산한다 (구간끼리는 겹치지 않게 둘 것).
+조각만 다시 실행될 때는 page 끝의 report() 가 돌지 않으므로, timer.fragment 로 만든 조각이
+그 실행만 새로 재서 조각 끝에서 보고한다 (로그에 "fragment": 조각 이름, 표는 조각 안에).
+사이드바 맨 아래 '⏱ 구간별 실행 시간' 토글이나 환경 변수 ESG_TIMING=1 로 켠다.
+꺼져 있으면 미리 만든 빈 컨텍스트를 돌려줄 뿐 시계를 읽지 않는다.
+"""
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils.esg_data import CACHE_DIR
+
+LOG_FILE = CACHE_DIR / "timings.jsonl"
+TOGGLE_KEY = "debug_timing"
+
+_DISABLED = nullcontext()
+
+
+class PageTimer:
+    """rerun 한 번의 구간별 시간 기록기. page_timer() 로 만든다."""
+
+    def __init__(self, page, enabled):
+        self.page = page
+        self.enabled = enabled
+        self.sections = {}  # 이름 → [누적 초, 호출 수]
+        self.started = time.perf_counter()
+        self.fragment_name = None  # 조각만 다시 실행 중이면 그 조각 이름
+
+    def restart(self, fragment=None):
+        """기록을 비우고 다시 시작 (조각만 다시 실행될 때)."""
+        self.enabled = timing_enabled()
+        self.fragment_name = fragment
+        self.sections = {}
+        self.started = time.perf_counter()
+
+    def __call__(self, name):
+        if not self.enabled:
+            return _DISABLED
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.sections.setdefault(name, [0.0, 0])
+            entry[0] += time.perf_counter() - start
+            entry[1] += 1
+
+    def wrap(self, name=None):
+        """함수 전체를 한 구간으로 재는 데코레이터 (이름을 생략하면 함수 이름)."""
+        def decorator(fn):
+            label = name or fn.__name__
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self(label):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def fragment(self, name):
+        """st.fragment 대신 쓰는 데코레이터.
+
+        전체 실행 중에는 페이지 기록에 그대로 합산된다. 이 조각만 다시 실행되면 기록을
+        새로 시작해 조각 끝에서 report() 한다 (안쪽 조각은 바깥 조각 기록에 합산).
+        """
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if self.fragment_name is not None or not fragment_rerun():
+                    return fn(*args, **kwargs)
+                self.restart(name)
+                try:
+                    result = fn(*args, **kwargs)
+                    self.report()
+                    return result
+                finally:
+                    self.fragment_name = None
+            return st.fragment(wrapper)
+        return decorator
+
+    def record(self):
+        """이번 rerun 기록 (JSONL 한 줄 내용)."""
+        total = time.perf_counter() - self.started
+        measured = sum(seconds for seconds, _ in self.sections.values())
+        record = {
+            "time": datetime.now().isoformat(timespec="milliseconds"),
+            "page": self.page,
+            "total": round(total, 6),
+            "unmeasured": round(total - measured, 6),
+            "sections": {
+                name: {"seconds": round(seconds, 6), "calls": calls}
+                for name, (seconds, calls) in self.sections.items()
+            },
+        }
+        if self.fragment_name is not None:
+            record["fragment"] = self.fragment_name
+        return record
+
+    def report(self):
+        """사이드바에 토글을 그리고, 켜져 있으면 구간별 표 표시 + 로그 기록.
+
+        조각만 다시 실행된 경우엔 토글 없이 조각 안에 접힌 표를 그린다
+        (조각은 전체 실행 때 쓰지 않은 사이드바 자리에 새로 쓸 수 없음).
+        """
+        if self.fragment_name is None:
+            st.sidebar.toggle("⏱ 구간별 실행 시간", key=TOGGLE_KEY)
+        if not self.enabled:
+            return
+        record = self.record()
+        append_log(record)
+        rows = pd.DataFrame(
+            [(name, s["seconds"] * 1000, s["calls"]) for name, s in record["sections"].items()],
+            columns=["구간", "ms", "호출"],
+        ).sort_values("ms", ascending=False)
+        if self.fragment_name is None:
+            panel = st.sidebar.expander("⏱ 이번 실행", expanded=True)
+        else:
+            panel = st.expander(f"⏱ 이번 실행 (조각: {self.fragment_name})")
+        with panel:
+            st.dataframe(rows.style.format({"ms": "{:,.1f}"}), hide_index=True)
+            st.caption(f"합계 {record['total'] * 1000:,.0f} ms · 구간 밖 {record['unmeasured'] * 1000:,.0f} ms")
+
+
+def timing_enabled():
+    return os.environ.get("ESG_TIMING") == "1" or bool(st.session_state.get(TOGGLE_KEY, False))
+
+
+def fragment_rerun():
+    """지금 실행이 조각만 다시 실행하는 것인지 (전체 실행이면 False)."""
+    ctx = get_script_run_ctx()
+    return bool(ctx and ctx.fragment_ids_this_run)
+
+
+def page_timer(page):
+    """페이지 맨 위에서 한 번 호출. 토글 상태(이전 실행 값)로 켜짐 여부를 정한다."""
+    return PageTimer(page, timing_enabled())
+
+
+def append_log(record, path=LOG_FILE):
+    """JSONL 로그에 한 줄 추가 (쓰기 실패는 무시)."""
+    try:
+        path.parent.mkdir(exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError:
+        pass
@@ -0,0 +1,123 @@
+"""업로드 CSV 스트리밍 집계 (01_주제1.py).
+
+업로드 파일을 청크 단위로 읽으면서 평균과 국가별 차트용 집계를 누적한다.
+파일 전체를 object 컬럼 프레임으로 메모리에 올리지 않는다.
+집계 결과는 파일 내용 해시로 캐시해 재실행·재업로드 시 해시만 계산한다.
+"""
+import hashlib
+
+import pandas as pd
+import streamlit as st
+
+from utils.lru import SizedLRU
+
+# 필요한 컬럼과 고정 타입
+UPLOAD_DTYPES = {
+    "Country": "category",
+    "Energy_Consumption": "float64",
+    "GDP": "float64",
+}
+VALUE_COLUMNS = ["Energy_Consumption", "GDP"]
+
+CHUNK_ROWS = 200_000
+
+# 미리보기로 보여 줄 앞부분 행 수
+PREVIEW_ROWS = 1_000
+
+# 업로드 집계 캐시 한도 (모든 세션 공용)
+UPLOAD_CACHE_BYTES = 256 * 1024 * 1024
+UPLOAD_CACHE_ENTRIES = 32
+
+
+def missing_columns(file):
+    """헤더만 읽어 없는 필수 컬럼 목록 반환 (파일 위치는 처음으로 되돌림)."""
+    file.seek(0)
+    columns = pd.read_csv(file, nrows=0).columns
+    file.seek(0)
+    return [col for col in UPLOAD_DTYPES if col not in columns]
+
+
+def stream_upload(file, chunk_rows=CHUNK_ROWS, progress=None):
+    """CSV 를 청크로 읽어 요약 dict 반환.
+
+    반환: rows(행 수), preview(앞부분 프레임), means(컬럼별 평균 Series),
+    by_country(국가별 평균 프레임, Country 인덱스).
+    progress 가 있으면 읽은 비율(0~1)로 청크마다 호출한다.
+    """
+    missing = missing_columns(file)
+    if missing:
+        raise ValueError(f"필수 컬럼이 없습니다: {missing}")
+
+    total_size = getattr(file, "size", None)
+    rows = 0
+    preview = []
+    sums = pd.Series(0.0, index=VALUE_COLUMNS)
+    counts = pd.Series(0, index=VALUE_COLUMNS)
+    country_sums = []
+    country_counts = []
+
+    reader = pd.read_csv(file, usecols=list(UPLOAD_DTYPES), dtype=UPLOAD_DTYPES, chunksize=chunk_rows)
+    for chunk in reader:
+        if rows < PREVIEW_ROWS:
+            preview.append(chunk.head(PREVIEW_ROWS - rows))
+        rows += len(chunk)
+        values = chunk[VALUE_COLUMNS]
+        sums += values.sum()
+        counts += values.count()
+        grouped = values.groupby(chunk["Country"], observed=True)
+        country_sums.append(grouped.sum())
+        country_counts.append(grouped.count())
+        if progress and total_size:
+            progress(min(file.tell() / total_size, 1.0))
+
+    by_country = pd.DataFrame(columns=VALUE_COLUMNS, dtype="float64")
+    if rows:
+        # 청크별 부분합을 국가 기준으로 합친 뒤 평균 (첫 등장 순서 유지)
+        total = pd.concat(country_sums).groupby(level=0, sort=False).sum()
+        count = pd.concat(country_counts).groupby(level=0, sort=False).sum()
+        by_country = total / count
+        by_country.index = by_country.index.astype(str)
+        by_country.index.name = "Country"
+    return {
+        "rows": rows,
+        "preview": pd.concat(preview, ignore_index=True) if preview else pd.DataFrame(columns=list(UPLOAD_DTYPES)),
+        "means": sums / counts,
+        "by_country": by_country,
+    }
+
+
+def upload_digest(file):
+    """업로드 파일 내용의 sha256 (파일 위치는 처음으로 되돌림)."""
+    digest = hashlib.sha256()
+    file.seek(0)
+    for block in iter(lambda: file.read(1 << 20), b""):
+        digest.update(block)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def _stats_nbytes(stats):
+    return int(
+        stats["preview"].memory_usage(deep=True).sum()
+        + stats["by_country"].memory_usage(deep=True).sum()
+        + stats["means"].memory_usage(deep=True)
+    )
+
+
+@st.cache_resource
+def _upload_cache():
+    return SizedLRU(UPLOAD_CACHE_BYTES, UPLOAD_CACHE_ENTRIES)
+
+
+def cached_upload(file, progress=None):
+    """stream_upload 결과를 내용 해시로 캐시해 반환 (같은 파일은 다시 파싱하지 않음).
+
+    반환값은 세션 간 공유되므로 수정하지 말 것.
+    """
+    digest = upload_digest(file)
+    cache = _upload_cache()
+    stats = cache.get(digest)
+    if stats is None:
+        stats = stream_upload(file, progress=progress)
+        cache.put(digest, stats, _stats_nbytes(stats))
+    return stats
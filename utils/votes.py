@@ -0,0 +1,280 @@
+"""main.py 투표 저장소 (SQLite WAL, 단일 작성 스레드).
+
+클릭마다 연결을 열고 커밋하면 동시 클릭이 쓰기 잠금을 두고 다툰다. 여기서는 제출을
+큐에 넣기만 하고, 프로세스당 작성 스레드 하나가 큐를 모아(최대 FLUSH_SECONDS 간격,
+BATCH_SIZE 건) 한 트랜잭션으로 votes 행과 tallies 누계를 함께 기록한다.
+
+결과 표시는 메모리 집계(커밋된 누계 + 아직 쓰지 않은 제출, 시간 구간별 표 수)만 읽는다.
+집계는 시작할 때 tallies 와 최근 RATE_WINDOW 초의 표로 한 번 채우고, 이후로는 마지막으로
+반영한 투표 id 이후의 행(id > 마지막 id)만 읽어 더한다. 작성 스레드가 배치를 쓴 직후와,
+조용할 때는 SYNC_SECONDS 마다 읽으므로 다른 프로세스가 같은 DB 에 쓴 표도 반영된다.
+votes 전체를 세는 일은 verify() 로 직접 확인할 때뿐이다.
+
+사용법 (저장소 루트에서):
+    python -m utils.votes            # 보기별 누계와 전체 행 수 대조
+"""
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections import Counter
+from contextlib import closing
+
+import streamlit as st
+
+from utils.registry import ROOT
+
+VOTES_DB = ROOT / "votes.sqlite3"
+
+# 작성 스레드가 한 번에 모으는 최대 건수와 최대 대기 시간
+BATCH_SIZE = 500
+FLUSH_SECONDS = 0.2
+
+# 잠금 경합(SQLITE_BUSY/LOCKED)으로 배치 기록이 실패했을 때 다시 시도하는 횟수와 간격
+WRITE_RETRIES = 20
+RETRY_SECONDS = 0.1
+
+# 조용할 때 다른 프로세스가 쓴 표를 읽어 오는 간격
+SYNC_SECONDS = 1.0
+
+# 득표 속도 집계 구간과 메모리에 남기는 기간 (초)
+BUCKET_SECONDS = 10
+RATE_WINDOW = 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS votes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    option TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tallies (
+    option TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS votes_created ON votes (created);
+"""
+
+_STOP = object()
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _is_busy(exc):
+    """다른 연결이 잠금을 잡고 있어 생긴 일시적 오류인지 (다시 시도할 만한지)."""
+    code = getattr(exc, "sqlite_errorcode", None)
+    if code is not None:
+        # 확장 코드(SQLITE_BUSY_SNAPSHOT 등)도 하위 8비트가 기본 코드
+        return code & 0xFF in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+    return "locked" in str(exc) or "busy" in str(exc)
+
+
+def connect(path):
+    con = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    con.execute("PRAGMA journal_mode=WAL")
+    # WAL 에서는 NORMAL 이어도 커밋 순서가 지켜지고 fsync 가 체크포인트 때만 일어남
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.executescript(SCHEMA)
+    return con
+
+
+class VoteStore:
+    """프로세스당 하나. submit() 은 큐에 넣고 바로 돌아오며 기록은 작성 스레드가 한다."""
+
+    def __init__(self, path=VOTES_DB, batch_size=BATCH_SIZE, flush_seconds=FLUSH_SECONDS,
+                 sync_seconds=SYNC_SECONDS):
+        self.path = str(path)
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.sync_seconds = sync_seconds
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = Counter()   # 제출됐지만 아직 커밋 전
+        self._committed = {}        # 보기 → 커밋된 표 수
+        self._buckets = {}          # 구간 시작 시각 → Counter(보기 → 표 수)
+        self.last_id = 0            # 집계에 반영한 마지막 투표 id
+        self._con = connect(self.path)
+        self._load()
+        self._synced = time.monotonic()
+        self.written = 0            # 이 프로세스가 기록한 표 수
+        self.batches = 0
+        self._thread = threading.Thread(target=self._run, name="vote-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, option):
+        """표 하나 제출 (잠금 경합 없이 큐에만 넣음)."""
+        with self._lock:
+            self._pending[option] += 1
+        self._queue.put((option, time.time()))
+
+    def counts(self):
+        """보기별 누계 {보기: 표 수} (메모리 카운터, DB 를 읽지 않음)."""
+        with self._lock:
+            return dict(Counter(self._committed) + self._pending)
+
+    def snapshot(self, window=600):
+        """(마지막 반영 id, 보기별 누계, 최근 window 초의 구간별 표 수 {구간 시작: {보기: 표 수}})."""
+        since = time.time() - window
+        with self._lock:
+            buckets = {start: dict(counter) for start, counter in self._buckets.items() if start >= since}
+            return self.last_id, dict(Counter(self._committed) + self._pending), buckets
+
+    def flush(self, timeout=10):
+        """지금까지 제출한 표가 기록될 때까지 대기."""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout=10)
+
+    def verify(self):
+        """votes 전체를 보기별로 다시 세어 tallies 와 비교 → (tallies, 실제 행 수)."""
+        with closing(sqlite3.connect(self.path, timeout=30)) as con:
+            actual = dict(con.execute("SELECT option, COUNT(*) FROM votes GROUP BY option").fetchall())
+        return self._read_tallies(), actual
+
+    def _read_tallies(self):
+        with closing(sqlite3.connect(self.path, timeout=30)) as con:
+            return dict(con.execute("SELECT option, count FROM tallies").fetchall())
+
+    def _load(self):
+        # 누계와 마지막 id 를 같은 읽기 트랜잭션에서 가져와 어긋나지 않게 함
+        with self._con:
+            self._con.execute("BEGIN")
+            self._committed = dict(self._con.execute("SELECT option, count FROM tallies").fetchall())
+            self.last_id = self._con.execute("SELECT COALESCE(MAX(id), 0) FROM votes").fetchone()[0]
+            recent = self._con.execute(
+                "SELECT option, created FROM votes WHERE created >= ? AND id <= ?",
+                (time.time() - RATE_WINDOW, self.last_id),
+            ).fetchall()
+        for option, created in recent:
+            self._bucket(created)[option] += 1
+
+    def _bucket(self, created):
+        start = created - created % BUCKET_SECONDS
+        counter = self._buckets.get(start)
+        if counter is None:
+            counter = self._buckets[start] = Counter()
+        return counter
+
+    def _sync(self, written=None):
+        """last_id 이후 커밋된 표(모든 프로세스)를 집계에 더함. written 은 방금 이 스레드가 쓴 보기별 수."""
+        rows = self._con.execute(
+            "SELECT id, option, created FROM votes WHERE id > ? ORDER BY id", (self.last_id,)
+        ).fetchall()
+        with self._lock:
+            for _, option, created in rows:
+                self._committed[option] = self._committed.get(option, 0) + 1
+                self._bucket(created)[option] += 1
+            if rows:
+                self.last_id = rows[-1][0]
+            if written:
+                self._pending -= written
+            # 기간이 지난 구간 정리
+            oldest = time.time() - RATE_WINDOW
+            for start in [start for start in self._buckets if start < oldest]:
+                del self._buckets[start]
+        self._synced = time.monotonic()
+
+    def _try_sync(self, written=None):
+        """_sync 실패는 기록만 하고 넘어감 (다음 동기화 때 id > last_id 로 다시 읽음)."""
+        try:
+            self._sync(written)
+        except Exception:
+            _LOGGER.exception("투표 집계 동기화 실패")
+            if written:
+                # 이미 커밋된 표: 대기 중에서는 빼 두고, 집계에는 다음 동기화 때 더해짐
+                with self._lock:
+                    self._pending -= written
+
+    def _write(self, batch):
+        """batch 를 한 트랜잭션으로 기록 → 보기별 수."""
+        by_option = Counter(option for option, _ in batch)
+        with self._con:
+            self._con.executemany("INSERT INTO votes (option, created) VALUES (?, ?)", batch)
+            self._con.executemany(
+                "INSERT INTO tallies (option, count) VALUES (?, ?) "
+                "ON CONFLICT(option) DO UPDATE SET count = count + excluded.count",
+                by_option.items(),
+            )
+        self.written += len(batch)
+        self.batches += 1
+        return by_option
+
+    def _run(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self.sync_seconds)
+            except queue.Empty:
+                self._try_sync()
+                continue
+            batch, waiters, stop = [], [], False
+            deadline = time.monotonic() + self.flush_seconds
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if stop or waiters or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            written = None
+            try:
+                # 트랜잭션만 다시 시도 (커밋 뒤 동기화가 실패해도 같은 배치를 다시 넣지 않게)
+                for attempt in range(WRITE_RETRIES if batch else 0):
+                    try:
+                        written = self._write(batch)
+                        break
+                    except sqlite3.OperationalError as exc:
+                        # 다른 프로세스가 잠금을 오래 잡은 경우만 다시 시도
+                        # (읽기 전용 DB·디스크 오류·테이블 없음 등은 바로 아래에서 포기)
+                        if not _is_busy(exc) or attempt == WRITE_RETRIES - 1:
+                            raise
+                        time.sleep(RETRY_SECONDS)
+            except Exception:
+                # 다시 시도해도 안 되는 오류: 이 배치만 버리고 스레드는 계속 (큐에 남은 표는 그대로 기록)
+                _LOGGER.exception("투표 %d건 기록 실패", len(batch))
+                with self._lock:
+                    self._pending -= Counter(option for option, _ in batch)
+            # 방금 쓴 행도 id 순서대로 읽어 반영 (대기 중 표에서는 뺌)
+            if written or time.monotonic() - self._synced >= self.sync_seconds:
+                self._try_sync(written)
+            for event in waiters:
+                event.set()
+            if stop:
+                self._con.close()
+                return
+
+
+@st.cache_resource(show_spinner=False)
+def _store(path):
+    return VoteStore(path)
+
+
+def get_vote_store():
+    """프로세스 공용 투표 저장소 (모든 세션이 같은 작성 스레드를 씀)."""
+    return _store(str(VOTES_DB))
+
+
+def main():
+    store = VoteStore()
+    tallies, actual = store.verify()
+    store.close()
+    print(f"{'보기':<10} {'누계':>8} {'행 수':>8}")
+    for option in sorted(set(tallies) | set(actual)):
+        mark = "" if tallies.get(option) == actual.get(option) else "  ⚠️ 불일치"
+        print(f"{option:<10} {tallies.get(option, 0):>8,} {actual.get(option, 0):>8,}{mark}")
+
+
+if __name__ == "__main__":
+    main()